@@ -1,11 +1,18 @@
 # -*- mode: python ; coding: utf-8 -*-
+import sys
+
+# Gera o pacote de assets pré-escalados (assets/assets.pack) antes de empacotar;
+# o executável leva só o pacote, não os PNGs de origem
+sys.path.insert(0, SPECPATH)
+from spacecleaner.assetpack import build_pack
+build_pack()
 
 
 a = Analysis(
     ['arcSpacshpPrototype.py'],
     pathex=[],
     binaries=[],
-    datas=[('assets', 'assets')],
+    datas=[('assets/assets.pack', 'assets')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
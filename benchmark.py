@@ -0,0 +1,261 @@
+"""
+Benchmark headless e determinístico do Space Cleaner.
+
+Roda as funções de renderização e simulação do jogo com o driver de vídeo
+'dummy' do SDL (sem janela e sem GPU), com semente fixa e entradas roteirizadas.
+
+Exemplos:
+    python benchmark.py
+    python benchmark.py --frames 600 --enemies 2000 --bullets 300 --ship laser
+    python benchmark.py --scenario game collisions --json resultado.json
+    python benchmark.py --startup
+"""
+
+import os
+
+# O driver precisa ser escolhido antes de importar o pygame/jogo
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import gc
+import json
+import random
+import subprocess
+import sys
+import tracemalloc
+from time import perf_counter
+
+import numpy as np
+import pygame
+
+from spacecleaner import display, game, screens, states
+from spacecleaner.dirty import DirtyRenderer
+from spacecleaner.config import FIRST_FRAME_TARGET_MS, HEIGHT, SIM_STEP_MS, WIDTH
+from spacecleaner.ship import ship1_cfg, ship2_cfg
+
+SCENARIOS = ("menu", "character_select", "pause", "lose", "game", "spawn", "collisions")
+
+# =============================================================================
+# ENTRADAS ROTEIRIZADAS
+# =============================================================================
+
+class ScriptedKeys:
+    """Substitui pygame.key.get_pressed com um padrão de teclas determinístico"""
+
+    def __init__(self):
+        self.frame = 0
+
+    def __getitem__(self, key):
+        # Sobe e desce em ciclos de 40 frames, avançando a cada 150
+        phase = self.frame // 40 % 2
+        if key == pygame.K_UP:
+            return phase == 0
+        if key == pygame.K_DOWN:
+            return phase == 1
+        if key == pygame.K_RIGHT:
+            return self.frame % 150 < 20
+        return False
+
+# =============================================================================
+# PREPARAÇÃO DOS CENÁRIOS
+# =============================================================================
+
+def start_game(ship_type):
+    """Começa uma partida com a nave escolhida"""
+    states.game_state = states.GAME
+    return game.GameSession(ship1_cfg if ship_type == "bullet" else ship2_cfg)
+
+def fill_entities(session, enemy_count, bullet_count):
+    """Completa os inimigos e projéteis espalhados pela tela até as quantidades pedidas"""
+    while session.enemies.count < enemy_count:
+        slot = session.enemies.slot_of(session.spawn_enemy())
+        session.enemies.x[slot] = random.uniform(0, WIDTH)
+    while session.bullets.count < bullet_count:
+        session.bullets.acquire(
+            x=random.uniform(0, WIDTH),
+            y=random.uniform(0, HEIGHT),
+            w=20, h=6
+        )
+
+def make_frame(scenario, args):
+    """Retorna a função que executa um frame do cenário e a partida usada (None nos menus)"""
+    keys = ScriptedKeys()
+    renderer = DirtyRenderer()
+
+    # Telas de menu: a seleção muda a cada 30 frames
+    menus = {
+        "menu": (screens.draw_menu, 2),
+        "pause": (screens.draw_pause, 3),
+        "lose": (screens.draw_lose, 3),
+        "character_select": (
+            lambda renderer, selected: screens.draw_character_select(renderer, selected, screens.slots,
+                                                                     perf_counter()), 2
+        ),
+    }
+    if scenario in menus:
+        draw, options = menus[scenario]
+        def frame():
+            keys.frame += 1
+            if args.full_redraw:
+                renderer.invalidate()
+            return draw(renderer, keys.frame // 30 % options)
+        return frame, None
+
+    session = start_game(args.ship)
+
+    if scenario == "spawn":
+        def frame():
+            session.enemies.clear()
+            for _ in range(max(args.enemies, 1)):
+                session.spawn_enemy()
+        return frame, session
+
+    if scenario == "collisions":
+        def frame():
+            fill_entities(session, args.enemies, args.bullets)
+            session.lives = 3
+            session.detect_collisions()
+        return frame, session
+
+    def frame():
+        keys.frame += 1
+        fill_entities(session, args.enemies, args.bullets)
+        session.lives = 3
+        if keys.frame % 7 == 0:
+            session.fire()
+        session.draw(keys, SIM_STEP_MS)
+    return frame, session
+
+# =============================================================================
+# MEDIÇÃO
+# =============================================================================
+
+def run_scenario(scenario, args):
+    """Mede tempo e alocações por frame de um cenário"""
+    random.seed(args.seed)
+    frame, session = make_frame(scenario, args)
+
+    for _ in range(args.warmup):
+        frame()
+
+    # Tempo por frame (sem tracemalloc, que deixaria tudo mais lento) e coletas do GC
+    times = np.zeros(args.frames)
+    gc_before = sum(stat["collections"] for stat in gc.get_stats())
+    for i in range(args.frames):
+        start = perf_counter()
+        dirty = frame()
+        if args.flip:
+            display.present(dirty)
+        times[i] = perf_counter() - start
+    gc_runs = sum(stat["collections"] for stat in gc.get_stats()) - gc_before
+
+    # Alocações do heap do Python: pico transitório e saldo por frame
+    alloc_frames = min(args.frames, args.alloc_frames)
+    peaks = np.zeros(alloc_frames)
+    net = 0
+    tracemalloc.start()
+    for i in range(alloc_frames):
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        frame()
+        after, peak = tracemalloc.get_traced_memory()
+        peaks[i] = peak - before
+        net += after - before
+    tracemalloc.stop()
+
+    ms = times * 1000
+    result = {
+        "scenario": scenario,
+        "frames": args.frames,
+        "fps": args.frames / times.sum(),
+        "mean_ms": float(ms.mean()),
+        "p95_ms": float(np.percentile(ms, 95)),
+        "p99_ms": float(np.percentile(ms, 99)),
+        "alloc_peak_kb": float(peaks.mean() / 1024) if alloc_frames else 0.0,
+        "alloc_net_kb": net / 1024 / alloc_frames if alloc_frames else 0.0,
+        "gc_per_1k": gc_runs * 1000 / args.frames,
+    }
+    if session is not None:
+        result.update({
+            "enemies": int(session.enemies.count),
+            "bullets": int(session.bullets.count),
+            "pools": session.pool_stats(),
+        })
+        session.end()
+    return result
+
+def measure_startup(runs):
+    """Mede o tempo até o primeiro frame em processos novos (mediana de várias execuções)"""
+    times = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-m", "spacecleaner", "--first-frame"],
+            capture_output=True, text=True, check=True
+        ).stdout
+        line = next(l for l in out.splitlines() if l.startswith("primeiro frame:"))
+        times.append(float(line.split()[2]))
+    return float(np.median(times))
+
+def print_pools(pools):
+    """Resumo dos pools de entidades, superfícies e partículas"""
+    for name in ("bullets", "enemies"):
+        stats = pools[name]
+        print(f"pool {name}: pico {stats['high_water']}/{stats['capacity']}, "
+              f"realocações {stats['grows']}")
+    print(f"pool superfícies: pico {pools['surfaces']['high_water']}, "
+          f"criadas {pools['surfaces']['allocations']}")
+    effects = pools["particles"]
+    print(f"partículas: {effects['count']} vivas, limite {effects['limit']}/{effects['capacity']}, "
+          f"recicladas {effects['recycled']}, custo médio {effects['cost_ms']:.2f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark headless do Space Cleaner")
+    parser.add_argument("--scenario", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--warmup", type=int, default=60)
+    parser.add_argument("--alloc-frames", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--enemies", type=int, default=200)
+    parser.add_argument("--bullets", type=int, default=50)
+    parser.add_argument("--ship", choices=("bullet", "laser"), default="bullet")
+    parser.add_argument("--flip", action="store_true", help="inclui pygame.display.flip/update")
+    parser.add_argument("--render-scale", type=float, default=1.0,
+                        help="resolução interna em relação a 1920x1080")
+    parser.add_argument("--full-redraw", action="store_true",
+                        help="redesenha as telas estáticas inteiras (sem retângulos sujos)")
+    parser.add_argument("--json", help="salva os resultados neste arquivo")
+    parser.add_argument("--startup", action="store_true",
+                        help="mede apenas o tempo até o primeiro frame")
+    parser.add_argument("--startup-runs", type=int, default=5)
+    args = parser.parse_args()
+    
+    if args.startup:
+        ms = measure_startup(args.startup_runs)
+        status = "ok" if ms <= FIRST_FRAME_TARGET_MS else "acima da meta"
+        print(f"primeiro frame: {ms:.1f} ms (mediana de {args.startup_runs}, "
+              f"meta {FIRST_FRAME_TARGET_MS} ms, {status})")
+        return
+    
+    display.init(args.render_scale)
+
+    results = [run_scenario(scenario, args) for scenario in args.scenario]
+
+    print(f"{'cenário':<18}{'fps':>10}{'média ms':>10}{'p95 ms':>9}{'p99 ms':>9}"
+          f"{'pico kB':>9}{'saldo kB':>10}{'gc/1k':>7}")
+    for r in results:
+        print(f"{r['scenario']:<18}{r['fps']:>10.1f}{r['mean_ms']:>10.3f}{r['p95_ms']:>9.3f}"
+              f"{r['p99_ms']:>9.3f}{r['alloc_peak_kb']:>9.1f}{r['alloc_net_kb']:>10.2f}"
+              f"{r['gc_per_1k']:>7.1f}")
+    
+    # Picos de uso dos pools na última partida da bateria
+    games = [r for r in results if "pools" in r]
+    if games:
+        print_pools(games[-1]["pools"])
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"args": vars(args), "results": results}, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+"""
+Space Cleaner - arcade de nave 2.5D em pygame.
+
+O pacote só abre a janela quando main() é chamado; a partida (NumPy, atlas,
+colisões) e seus sprites são carregados em segundo plano enquanto o menu já
+está na tela.
+"""
+
+from time import perf_counter
+
+# Referência para medir o tempo até o primeiro frame
+STARTUP_TIME = perf_counter()
+
+def main(argv=None):
+    """Inicia o jogo"""
+    from .app import main as run
+    run(argv)
@@ -0,0 +1,5 @@
+"""Permite rodar o jogo com `python -m spacecleaner`"""
+
+from . import main
+
+main()
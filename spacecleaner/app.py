@@ -0,0 +1,159 @@
+"""Loop principal e ponto de entrada do jogo"""
+
+import argparse
+import threading
+from time import perf_counter
+
+import pygame
+
+from . import STARTUP_TIME, display, states
+from .assets import GAMEPLAY_IMAGES, assets
+from .config import FIRST_FRAME_TARGET_MS, RENDER_SCALE, SCORES_FILE, TARGET_FPS
+from .profiler import export_profile, profiler
+from .quality import QUALITY_TIERS, quality
+from .scenes import SceneStack, load_game_module, quit_game
+from .scores import score_store
+from .text import NEON_LAYERS, set_neon_layers
+
+# =============================================================================
+# CARREGAMENTO PREGUIÇOSO DA PARTIDA
+# =============================================================================
+
+def preload_gameplay():
+    """Importa a partida e decodifica os sprites enquanto o menu já está na tela"""
+    load_game_module()
+    assets.decode(GAMEPLAY_IMAGES)
+
+# =============================================================================
+# QUALIDADE GRÁFICA
+# =============================================================================
+
+# Resolução interna escolhida na linha de comando, a pedida pelo nível de
+# qualidade e a que está em uso
+base_scale = RENDER_SCALE
+target_scale = RENDER_SCALE
+applied_scale = RENDER_SCALE
+
+def apply_quality(tier):
+    """Aplica o nível às telas: camadas do neon e resolução interna (esta adiada)"""
+    global target_scale
+    set_neon_layers(round(NEON_LAYERS * tier.neon_density))
+    target_scale = base_scale * tier.render_scale
+
+def apply_render_scale(scenes):
+    """Troca a resolução interna pedida, fora de transições e sem quadro congelado (pausa)"""
+    global applied_scale
+    if target_scale == applied_scale or states.transition["active"]:
+        return
+    if any(getattr(scene, "frozen", None) is not None for scene in scenes.stack):
+        return
+    applied_scale = target_scale
+    display.set_render_scale(applied_scale)
+    
+    # As telas redesenham tudo e a partida, se houver, refaz seus sprites na nova escala
+    scenes.rescale()
+
+# =============================================================================
+# LOOP PRINCIPAL
+# =============================================================================
+
+def main(argv=None):
+    """Executa o loop principal do jogo"""
+    global base_scale, applied_scale
+    parser = argparse.ArgumentParser(description="Space Cleaner")
+    parser.add_argument("--first-frame", action="store_true",
+                        help="mostra o tempo até o primeiro frame e sai")
+    parser.add_argument("--render-scale", type=float, default=RENDER_SCALE,
+                        help="resolução interna em relação a 1920x1080 (ex.: 0.5)")
+    parser.add_argument("--record", metavar="DIR",
+                        help="grava as entradas de cada partida neste diretório (ver spacecleaner.replay)")
+    parser.add_argument("--scores", metavar="FILE", default=SCORES_FILE,
+                        help="banco SQLite dos recordes e sessões")
+    parser.add_argument("--quality", default="auto", choices=["auto"] + [t.name for t in QUALITY_TIERS],
+                        help="nível de qualidade gráfica fixo (padrão: ajuste automático pelo tempo de frame)")
+    args = parser.parse_args(argv)
+    
+    base_scale = applied_scale = args.render_scale
+    display.init(args.render_scale)
+    score_store.open(args.scores)
+    if args.quality != "auto":
+        quality.set_tier(args.quality, auto=False)
+    quality.on_change(apply_quality)
+    clock = display.clock
+    threading.Thread(target=preload_gameplay, name="gameplay-preload", daemon=True).start()
+    scenes = SceneStack(record_dir=args.record)
+    
+    while True:
+        dt = clock.tick(TARGET_FPS)
+        profiler.begin_frame()
+        t = perf_counter()
+        keys = pygame.key.get_pressed()
+        
+        # Aplica trocas de cena concluídas no frame anterior (ex.: meio de um fade)
+        scenes.sync()
+        apply_render_scale(scenes)
+        
+        # Processa eventos
+        profiler.start("eventos")
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                quit_game(scenes)
+            
+            # Atalhos do profiler: F3 mostra o overlay, F4 exporta o trace
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                profiler.show_overlay = not profiler.show_overlay
+                scenes.top.invalidate()
+                continue
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                export_profile()
+                continue
+            
+            # Bloqueia inputs durante transições
+            if event.type == pygame.KEYDOWN:
+                if states.transition["active"] and states.transition["phase"] == "fade_out":
+                    continue
+                scenes.top.handle_key(event.key)
+        
+        profiler.stop("eventos")
+        
+        # Renderiza a cena do topo (a partida cronometra suas próprias fases)
+        # As telas estáticas retornam só as regiões que mudaram
+        scenes.sync()
+        scene = scenes.top
+        # No fade out a tela mostra o último frame do estado anterior
+        # (compose_transition), então a cena não precisa renderizar
+        dirty = None
+        if not states.showing_snapshot():
+            if scene.full_redraw:
+                scene.render(keys, dt, t)
+            else:
+                profiler.start("render")
+                dirty = scene.render(keys, dt, t)
+                profiler.stop("render")
+        
+        # Compõe a transição ativa sobre o frame
+        with profiler.section("transicao"):
+            in_transition = states.compose_transition(display.screen)
+        
+        # Fades, o overlay do profiler e a partida pintam sobre a tela inteira:
+        # nesses frames a tela toda é enviada e o próximo frame estático é completo
+        if in_transition or profiler.show_overlay or scene.full_redraw:
+            scene.invalidate()
+            dirty = None
+        
+        # Amplia para a janela; o overlay do profiler fica na resolução nativa
+        with profiler.section("flip"):
+            display.present(dirty, profiler.draw_overlay if profiler.show_overlay else None)
+        profiler.end_frame()
+        
+        # Tempo de trabalho do frame (sem a espera do clock.tick) para o governador de qualidade
+        quality.observe((perf_counter() - t) * 1000)
+        
+        # Tempo desde o início do processo até o primeiro frame visível
+        if profiler.first_frame_ms is None:
+            profiler.first_frame_ms = (perf_counter() - STARTUP_TIME) * 1000
+            if args.first_frame:
+                status = "ok" if profiler.first_frame_ms <= FIRST_FRAME_TARGET_MS else "acima da meta"
+                print(f"primeiro frame: {profiler.first_frame_ms:.1f} ms "
+                      f"(meta {FIRST_FRAME_TARGET_MS} ms, {status})")
+                quit_game(scenes)
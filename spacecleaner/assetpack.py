@@ -0,0 +1,173 @@
+"""
+Pacote de assets pré-processado.
+
+Um único arquivo binário com as imagens já escaladas, em pixels crus no
+layout BGRA (o formato nativo da tela na maioria das plataformas), mais um
+manifesto JSON. Em tempo de execução o arquivo é mapeado na memória e cada
+imagem vira uma Surface via pygame.image.frombuffer, sem decodificar PNG.
+
+Gerar o pacote (o SpaceCleaner.spec faz isso antes de empacotar):
+    python -m spacecleaner.assetpack
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import zlib
+
+import pygame
+
+# Arquivo do pacote, relativo à raiz dos recursos
+PACK_FILE = "assets/assets.pack"
+
+# Cabeçalho: assinatura, versão do formato e tamanho do manifesto
+MAGIC = b"SCPK"
+VERSION = 2
+HEADER = struct.Struct("<4sII")
+
+PIXEL_FORMAT = "BGRA"
+BYTES_PER_PIXEL = 4
+ALIGNMENT = 64
+
+def pack_key(name, size=None):
+    """Nome da entrada no pacote (com o tamanho, para versões escaladas)"""
+    return name if size is None else f"{name}@{size[0]}x{size[1]}"
+
+def source_stamp(path):
+    """Tamanho, data de modificação e CRC-32 do arquivo de origem"""
+    with open(path, "rb") as f:
+        data = f.read()
+    return {"bytes": len(data), "mtime_ns": os.stat(path).st_mtime_ns, "crc32": zlib.crc32(data)}
+
+# =============================================================================
+# LEITURA
+# =============================================================================
+
+class AssetPack:
+    """Pacote de imagens lido do disco via mmap
+
+    Cada entrada guarda o arquivo de origem (tamanho, data e CRC-32) e a
+    escala pedida em IMAGES; se algum deles mudou desde a geração, a entrada
+    é ignorada e o jogo usa o PNG. Sem source_root (o executável, que leva
+    só o pacote gerado junto com ele) as entradas valem sem conferir a origem.
+    """
+
+    def __init__(self, path, source_root=None):
+        self.source_root = source_root
+        # Arquivo de origem -> se ainda é o mesmo da geração do pacote
+        self._fresh = {}
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, manifest_len = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError(f"pacote de assets inválido: {path}")
+
+        start = HEADER.size
+        self.manifest = json.loads(self._map[start:start + manifest_len])
+        self._data = start + manifest_len
+
+    def has(self, key, source, scale):
+        """Indica se a entrada existe e foi gerada do arquivo dado, sem alterações, na escala dada"""
+        entry = self.manifest.get(key)
+        if entry is None or entry["source"] != source:
+            return False
+        if entry["scale"] != (list(scale) if scale else None):
+            return False
+        if self.source_root is None:
+            return True
+        fresh = self._fresh.get(source)
+        if fresh is None:
+            fresh = self._fresh[source] = self._check_source(source, entry["stamp"])
+        return fresh
+
+    def _check_source(self, source, stamp):
+        path = os.path.join(self.source_root, source)
+        try:
+            st = os.stat(path)
+            if st.st_size != stamp["bytes"]:
+                return False
+            # Mesma data: inalterado; data diferente (cópia, checkout) ainda
+            # vale se o conteúdo for o mesmo da geração
+            return st.st_mtime_ns == stamp["mtime_ns"] or source_stamp(path)["crc32"] == stamp["crc32"]
+        except OSError:
+            # Sem o original não há com o que comparar nem para onde voltar
+            return True
+
+    def surface(self, key):
+        """Surface apoiada diretamente nos bytes mapeados (ainda sem converter)"""
+        entry = self.manifest[key]
+        w, h = entry["size"]
+        offset = self._data + entry["offset"]
+        view = memoryview(self._map)[offset:offset + w * h * BYTES_PER_PIXEL]
+        return pygame.image.frombuffer(view, (w, h), PIXEL_FORMAT)
+
+# =============================================================================
+# GERAÇÃO
+# =============================================================================
+
+def pack_variants():
+    """Versões escaladas usadas pelo jogo: naves na partida e na seleção"""
+    from .screens import PREVIEW_SIZE
+    from .ship import ship1_cfg, ship2_cfg
+
+    variants = [(cfg["img"], cfg["size"]) for cfg in (ship1_cfg, ship2_cfg)]
+    variants += [(name, PREVIEW_SIZE) for name in ("ship1", "ship2")]
+    return variants
+
+def build_pack(path=None, variants=None):
+    """Decodifica, escala e grava todas as imagens num único arquivo"""
+    from .assets import IMAGES, resource_path
+
+    path = path or resource_path(PACK_FILE)
+    if variants is None:
+        variants = pack_variants()
+
+    images = {}
+    stamps = {}
+    for name, (source, scale, _) in IMAGES.items():
+        img = pygame.image.load(resource_path(source))
+        stamps[source] = source_stamp(resource_path(source))
+        images[name] = (source, scale, pygame.transform.scale(img, scale) if scale else img)
+    for name, size in variants:
+        source, scale, img = images[name]
+        images[pack_key(name, size)] = (source, scale, pygame.transform.scale(img, size))
+
+    # Manifesto com deslocamentos alinhados dentro da área de dados
+    manifest = {}
+    blobs = []
+    offset = 0
+    for key, (source, scale, img) in images.items():
+        data = pygame.image.tobytes(img, PIXEL_FORMAT)
+        manifest[key] = {"source": source, "stamp": stamps[source], "scale": list(scale) if scale else None,
+                         "size": list(img.get_size()), "offset": offset}
+        padding = -len(data) % ALIGNMENT
+        blobs.append(data + bytes(padding))
+        offset += len(data) + padding
+
+    manifest_bytes = json.dumps(manifest, separators=(",", ":")).encode()
+    manifest_bytes += b" " * (-(HEADER.size + len(manifest_bytes)) % ALIGNMENT)
+
+    # Grava num temporário e troca de uma vez, para nunca deixar um pacote pela metade
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(manifest_bytes)))
+        f.write(manifest_bytes)
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp_path, path)
+    return path, manifest
+
+def main():
+    parser = argparse.ArgumentParser(description="Gera o pacote de assets do Space Cleaner")
+    parser.add_argument("--output", help="caminho do pacote (padrão: assets/assets.pack)")
+    args = parser.parse_args()
+
+    path, manifest = build_pack(args.output)
+    print(f"{len(manifest)} imagens, {os.path.getsize(path) / 1024:.0f} kB -> {path}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""Carregamento de imagens sob demanda, com decodificação em segundo plano"""
+
+import os
+import struct
+import sys
+import threading
+
+import pygame
+
+from . import display
+from .assetpack import PACK_FILE, AssetPack, pack_key
+
+# =============================================================================
+# FUNÇÃO PARA CAMINHOS DE RECURSOS
+# =============================================================================
+
+def resource_path(relative_path):
+    """Retorna o caminho absoluto dos recursos"""
+    try:
+        base_path = sys._MEIPASS
+    except Exception:
+        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_path, relative_path)
+
+# =============================================================================
+# CARREGAMENTO DE ASSETS
+# =============================================================================
+
+# Imagens do jogo: nome -> (arquivo, escala, transparência)
+IMAGES = {
+    "menu_bg": ("assets/Menu.png", None, False),
+    "ship1": ("assets/Spaceship1.png", None, True),
+    "ship2": ("assets/Spaceship2.png", None, True),
+    "asteroid1": ("assets/Asteroid1.png", (80, 80), True),
+    "asteroid2": ("assets/Asteroid2.png", (80, 80), True),
+    "asteroid3": ("assets/Asteroid3.png", (80, 80), True),
+    "trash": ("assets/TrashBag.png", (45, 45), True),
+    "life": ("assets/Life.png", (50, 50), True),
+    "score": ("assets/Trophy.png", (50, 50), True),
+}
+
+# Sprites só necessários depois do menu (carregados em segundo plano)
+GAMEPLAY_IMAGES = ("ship1", "ship2", "asteroid1", "asteroid2", "asteroid3", "trash", "life", "score")
+
+class AssetLoader:
+    """Carrega imagens na primeira vez que são pedidas; pode decodificá-las antes numa thread
+
+    As imagens vêm do pacote pré-processado (assetpack) quando ele existe;
+    senão, os PNGs são decodificados e escalados como antes. Tamanhos são
+    lógicos: as superfícies retornadas já estão na escala do alvo de
+    renderização (display.scale), guardadas por (nome, escala).
+    """
+
+    def __init__(self, specs, pack_path=PACK_FILE):
+        self.specs = specs
+        self.pack_path = pack_path
+        self._pack = None
+        self._decoded = {}
+        self._surfaces = {}
+        self._lock = threading.Lock()
+
+    def _open_pack(self):
+        """Abre o pacote na primeira consulta (None se não existir ou for inválido)"""
+        with self._lock:
+            if self._pack is None:
+                try:
+                    # No executável só o pacote é distribuído: não há origem a conferir
+                    source_root = None if getattr(sys, "frozen", False) else resource_path("")
+                    self._pack = AssetPack(resource_path(self.pack_path), source_root)
+                except (OSError, ValueError, struct.error):
+                    self._pack = False
+            return self._pack or None
+
+    def _decode(self, name):
+        path, scale, _ = self.specs[name]
+        pack = self._open_pack()
+        if pack and pack.has(name, path, scale):
+            return pack.surface(name)
+        img = pygame.image.load(resource_path(path))
+        return pygame.transform.scale(img, scale) if scale else img
+
+    def _convert(self, name, img):
+        alpha = self.specs[name][2]
+        return img.convert_alpha() if alpha else img.convert()
+
+    @staticmethod
+    def _to_scale(img, scale):
+        if scale == 1.0:
+            return img
+        w, h = img.get_size()
+        return pygame.transform.scale(img, (max(1, round(w * scale)), max(1, round(h * scale))))
+
+    def decode(self, names):
+        """Decodifica e escala as imagens (seguro fora da thread principal)"""
+        for name in names:
+            with self._lock:
+                if name in self._decoded:
+                    continue
+            try:
+                img = self._decode(name)
+            except (pygame.error, OSError):
+                # O erro reaparece em get(), na thread principal
+                continue
+            with self._lock:
+                self._decoded.setdefault(name, img)
+
+    def get(self, name, scale=None):
+        """Retorna a imagem convertida para o formato da tela (na escala de renderização ou na dada)"""
+        scale = display.scale if scale is None else scale
+        key = (name, scale)
+        surf = self._surfaces.get(key)
+        if surf is None:
+            # A imagem decodificada fica guardada para gerar outras escalas
+            with self._lock:
+                img = self._decoded.get(name)
+            if img is None:
+                img = self._decode(name)
+                with self._lock:
+                    img = self._decoded.setdefault(name, img)
+            surf = self._surfaces[key] = self._to_scale(self._convert(name, img), scale)
+        return surf
+
+    def get_scaled(self, name, size, scale=None):
+        """Retorna a imagem num tamanho lógico fixo, escalando no máximo uma vez"""
+        scale = display.scale if scale is None else scale
+        key = (name, size, scale)
+        surf = self._surfaces.get(key)
+        if surf is None:
+            pixel_size = (round(size[0] * scale), round(size[1] * scale))
+            pack_name = pack_key(name, pixel_size)
+            pack = self._open_pack()
+            if pack and pack.has(pack_name, *self.specs[name][:2]):
+                surf = self._convert(name, pack.surface(pack_name))
+            else:
+                surf = pygame.transform.scale(self.get(name, scale), pixel_size)
+            self._surfaces[key] = surf
+        return surf
+
+    def put(self, name, surf):
+        """Registra uma superfície pronta com o nome dado (já na escala atual)"""
+        self._surfaces[(name, display.scale)] = surf
+
+assets = AssetLoader(IMAGES)
+
+def menu_background():
+    """Fundo do menu (cor sólida se a imagem não puder ser carregada)"""
+    try:
+        return assets.get("menu_bg")
+    except (pygame.error, OSError):
+        menu_bg = pygame.Surface(display.screen.get_size())
+        menu_bg.fill((10, 10, 30))
+        assets.put("menu_bg", menu_bg)
+        return menu_bg
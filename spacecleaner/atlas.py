@@ -0,0 +1,81 @@
+"""Atlas de sprites pré-renderizados em tamanhos e ângulos quantizados"""
+
+import pygame
+
+from .cache import LRUCache, surface_bytes
+
+# Quantização das rotações e dos tamanhos dos asteroides
+ANGLE_STEP = 5
+ASTEROID_SIZES = tuple(range(60, 121, 10))
+ATLAS_CACHE_BYTES = 64 * 1024 * 1024
+
+class SpriteAtlas:
+    """Guarda versões pré-renderizadas de imagens em tamanhos e ângulos quantizados"""
+    
+    def __init__(self, angle_step=ANGLE_STEP, max_bytes=ATLAS_CACHE_BYTES):
+        self.angle_step = angle_step
+        self.angle_count = 360 // angle_step
+        self._images = []
+        self._scaled = {}
+        self._frames = LRUCache(1 << 16, max_bytes=max_bytes)
+
+    def add(self, img):
+        """Registra uma imagem base e retorna seu identificador no atlas"""
+        self._images.append(img)
+        return len(self._images) - 1
+
+    def replace(self, image_id, img):
+        """Troca a imagem base (ex.: outra resolução), mantendo o identificador"""
+        self._images[image_id] = img
+        self._scaled = {key: base for key, base in self._scaled.items() if key[0] != image_id}
+        self._frames.clear()
+
+    def set_angle_step(self, angle_step):
+        """Troca o passo das rotações; os quadros são refeitos sob demanda"""
+        if angle_step != self.angle_step:
+            self.angle_step = angle_step
+            self.angle_count = 360 // angle_step
+            self._frames.clear()
+
+    def quantize_angle(self, angle):
+        """Converte um ângulo em graus para o índice do passo mais próximo"""
+        return round(angle / self.angle_step) % self.angle_count
+
+    def quantize_size(self, size, sizes=ASTEROID_SIZES):
+        """Retorna o tamanho pré-definido mais próximo"""
+        return min(sizes, key=lambda s: abs(s - size))
+
+    def get(self, image_id, size=None, angle=0):
+        """Retorna a imagem escalada e rotacionada a partir do cache"""
+        return self.frame(image_id, size, angle)[0]
+
+    def frame(self, image_id, size=None, angle=0):
+        """Retorna (imagem, meia largura, meia altura), para posicionar pelo centro sem Rect"""
+        step = self.quantize_angle(angle)
+        key = (image_id, size, step)
+        frame = self._frames.get(key)
+        if frame is None:
+            img = self._render(image_id, size, step)
+            w, h = img.get_size()
+            frame = (img, w // 2, h // 2)
+            self._frames.put(key, frame, surface_bytes(img))
+        return frame
+
+    def warm(self, image_id, sizes=(None,)):
+        """Pré-renderiza todos os ângulos de uma imagem nos tamanhos dados"""
+        for size in sizes:
+            for step in range(self.angle_count):
+                self.get(image_id, size, step * self.angle_step)
+
+    def _render(self, image_id, size, step):
+        base = self._scaled.get((image_id, size))
+        if base is None:
+            base = self._images[image_id]
+            if size is not None:
+                base = pygame.transform.scale(base, (size, size))
+            self._scaled[(image_id, size)] = base
+        if step == 0:
+            return base
+        return pygame.transform.rotate(base, step * self.angle_step)
+
+sprite_atlas = SpriteAtlas()
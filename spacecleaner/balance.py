@@ -0,0 +1,255 @@
+"""
+Simulador em lote para balancear a dificuldade.
+
+Roda milhares de partidas sem janela e sem renderização, cada uma com sua
+semente e pilotada por um piloto automático roteirizado, distribuídas por um
+pool de processos (um por núcleo). Para cada combinação de parâmetros
+(pontos por nível, aumento de velocidade por nível, chance do lixo espacial e
+nave) agrega o tempo de sobrevivência, a pontuação e as vidas perdidas.
+
+As mesmas sementes são usadas em todas as combinações, então as diferenças
+entre elas vêm dos parâmetros e não do sorteio.
+
+Exemplos:
+    python -m spacecleaner.balance
+    python -m spacecleaner.balance --games 500 --difficulty-steps 50 100 200
+    python -m spacecleaner.balance --speed-steps 0.1 0.25 0.5 --trash-chances 0.1 0.2 0.3 --json sweep.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+from itertools import product
+from time import perf_counter
+
+import numpy as np
+import pygame
+
+from .config import HEIGHT, SIM_STEP_MS, difficulty_step, speed_step
+from .enemies import ASTEROID_TYPE, TRASH, TRASH_TYPE
+from .profiler import percentile
+from .replay import KEY_BITS, StepKeys
+
+# Duração máxima de uma partida simulada (s de jogo); quem chega ao fim sobreviveu
+MAX_GAME_SECONDS = 600
+
+# Piloto automático: distância à frente (unidades lógicas) em que um inimigo
+# na faixa da nave vira perigo, e folga vertical da faixa
+AVOID_DISTANCE = 350
+AVOID_MARGIN = 12
+
+UP = KEY_BITS[pygame.K_UP]
+DOWN = KEY_BITS[pygame.K_DOWN]
+
+# =============================================================================
+# PILOTO AUTOMÁTICO
+# =============================================================================
+
+def autopilot(session, keys):
+    """Escolhe as teclas do próximo passo e pede um disparo
+
+    Desvia de inimigos próximos na faixa da nave; sem perigo, alinha com o
+    inimigo mais próximo à frente, com prioridade para o lixo (que custa
+    vida se escapar). Só lê o estado da partida, então é determinístico.
+    """
+    ship, enemies = session.ship, session.enemies
+    rect = ship.rect
+    keys.mask = 0
+    session.fire()
+    if not enemies.count:
+        return
+
+    x, y, size = enemies.x, enemies.y, enemies.size
+    centers = y + size / 2
+    ahead = x + size > rect.left
+
+    # Perigo: foge para o lado oposto ao centro das ameaças (ou para o único livre)
+    danger = (ahead & (x < rect.right + AVOID_DISTANCE)
+              & (y < rect.bottom + AVOID_MARGIN) & (y + size > rect.top - AVOID_MARGIN))
+    if danger.any():
+        threat = float(centers[danger].mean())
+        if rect.top - ship.speed < rect.height:
+            keys.mask = DOWN
+        elif rect.bottom + ship.speed > HEIGHT - rect.height:
+            keys.mask = UP
+        else:
+            keys.mask = UP if threat > rect.centery else DOWN
+        return
+
+    # Alvo: o mais próximo à frente, lixo primeiro
+    targets = ahead & (enemies.kind == TRASH)
+    if not targets.any():
+        targets = ahead
+        if not targets.any():
+            return
+    nearest = int(np.where(targets, x, np.inf).argmin())
+    center = float(centers[nearest])
+    if center < rect.centery - ship.speed:
+        keys.mask = UP
+    elif center > rect.centery + ship.speed:
+        keys.mask = DOWN
+
+# =============================================================================
+# PARTIDAS (nos processos do pool)
+# =============================================================================
+
+def init_worker():
+    """Prepara o processo: display sem janela e recursos da partida (sprites e máscaras)"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    from . import display, game
+    display.init()
+    game.load_resources()
+
+def make_session(game, params, seed):
+    """Partida sem janela com os parâmetros dados (os tipos de inimigo são cópias)"""
+    from .ship import SHIP_CONFIGS
+
+    trash = params["trash_chance"]
+    enemy_types = (ASTEROID_TYPE.replace(spawn_chance=1 - trash), TRASH_TYPE.replace(spawn_chance=trash))
+    return game.GameSession(SHIP_CONFIGS[params["ship"]], seed=seed, headless=True,
+                            difficulty_step=params["difficulty_step"],
+                            speed_step=params["speed_step"], enemy_types=enemy_types)
+
+def simulate(task):
+    """Joga uma partida com o piloto automático; retorna (índice dos parâmetros, resultado)"""
+    from . import game
+
+    index, params, seed, max_steps = task
+    session = make_session(game, params, seed)
+    start_lives = session.lives
+
+    keys = StepKeys()
+    steps = 0
+    while session.lives > 0 and steps < max_steps:
+        autopilot(session, keys)
+        session.update(keys)
+        steps += 1
+
+    result = {
+        "seed": seed,
+        "steps": steps,
+        "score": session.score,
+        "lives_lost": start_lives - max(session.lives, 0),
+        "survived": session.lives > 0,
+    }
+    session.end()
+    return index, result
+
+# =============================================================================
+# VARREDURA
+# =============================================================================
+
+def param_grid(args):
+    """Todas as combinações dos parâmetros pedidos"""
+    return [
+        {"difficulty_step": step, "speed_step": speed, "trash_chance": trash, "ship": ship}
+        for step, speed, trash, ship in product(args.difficulty_steps, args.speed_steps,
+                                                args.trash_chances, args.ships)
+    ]
+
+def summarize(params, results, start_lives=3):
+    """Distribuições de sobrevivência (s), pontuação e vidas perdidas de uma combinação"""
+    seconds = sorted(r["steps"] * SIM_STEP_MS / 1000 for r in results)
+    scores = sorted(r["score"] for r in results)
+
+    def dist(values):
+        return {
+            "mean": sum(values) / len(values),
+            "p10": percentile(values, 10),
+            "p50": percentile(values, 50),
+            "p90": percentile(values, 90),
+        }
+
+    lives_lost = [0] * (start_lives + 1)
+    for r in results:
+        lives_lost[min(r["lives_lost"], start_lives)] += 1
+    return {
+        "params": params,
+        "games": len(results),
+        "survival_s": dist(seconds),
+        "score": dist(scores),
+        "lives_lost": lives_lost,
+        "survived": sum(r["survived"] for r in results) / len(results),
+    }
+
+def run_sweep(grid, games, seed=0, max_seconds=MAX_GAME_SECONDS, workers=None):
+    """Joga games partidas por combinação no pool e retorna os resumos e o total de passos"""
+    max_steps = round(max_seconds * 1000 / SIM_STEP_MS)
+    tasks = [(i, params, seed + g, max_steps) for i, params in enumerate(grid) for g in range(games)]
+    workers = workers or os.cpu_count() or 1
+    results = [[] for _ in grid]
+
+    if workers == 1:
+        init_worker()
+        done = map(simulate, tasks)
+        for i, result in done:
+            results[i].append(result)
+    else:
+        # Blocos pequenos o bastante para equilibrar partidas longas e curtas
+        chunksize = max(1, len(tasks) // (workers * 16))
+        # close() e join() em vez do terminate() do with: o SDL iniciado em
+        # cada processo troca o tratador de SIGTERM e o terminate() nunca volta
+        pool = multiprocessing.Pool(workers, init_worker)
+        try:
+            for i, result in pool.imap_unordered(simulate, tasks, chunksize):
+                results[i].append(result)
+        finally:
+            pool.close()
+            pool.join()
+
+    for r in results:
+        r.sort(key=lambda result: result["seed"])
+    total_steps = sum(result["steps"] for r in results for result in r)
+    return [summarize(params, r) for params, r in zip(grid, results)], total_steps
+
+# =============================================================================
+# RELATÓRIO
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulação em lote para balancear a dificuldade")
+    parser.add_argument("--games", type=int, default=200, help="partidas por combinação")
+    parser.add_argument("--difficulty-steps", type=int, nargs="+", default=[difficulty_step],
+                        help="pontos por nível de dificuldade")
+    parser.add_argument("--speed-steps", type=float, nargs="+", default=[speed_step],
+                        help="aumento da velocidade dos inimigos por nível")
+    parser.add_argument("--trash-chances", type=float, nargs="+", default=[TRASH_TYPE.spawn_chance],
+                        help="chance de o inimigo ser lixo espacial")
+    parser.add_argument("--ships", type=int, nargs="+", default=[0, 1], choices=(0, 1),
+                        help="naves (0 = projéteis, 1 = laser)")
+    parser.add_argument("--max-seconds", type=float, default=MAX_GAME_SECONDS,
+                        help="duração máxima de cada partida (s de jogo)")
+    parser.add_argument("--seed", type=int, default=0, help="semente da primeira partida")
+    parser.add_argument("--workers", type=int, default=None, help="processos (padrão: um por núcleo)")
+    parser.add_argument("--json", help="salva os resultados completos neste arquivo")
+    args = parser.parse_args()
+
+    grid = param_grid(args)
+    workers = args.workers or os.cpu_count() or 1
+    start = perf_counter()
+    summaries, total_steps = run_sweep(grid, args.games, args.seed, args.max_seconds, workers)
+    elapsed = perf_counter() - start
+
+    print(f"{'passo':>6}{'vel.':>6}{'lixo':>6}{'nave':>5} | {'sobrevivência s (média p10 p50 p90)':^36}"
+          f" | {'pontos (média p10 p50 p90)':^30} | vidas perdidas 0/1/2/3 | até o fim")
+    for s in summaries:
+        p, t, sc = s["params"], s["survival_s"], s["score"]
+        lost = "/".join(f"{n / s['games']:.0%}" for n in s["lives_lost"])
+        print(f"{p['difficulty_step']:>6}{p['speed_step']:>6.2f}{p['trash_chance']:>6.2f}{p['ship']:>5} | "
+              f"{t['mean']:>8.1f}{t['p10']:>8.1f}{t['p50']:>8.1f}{t['p90']:>8.1f}     | "
+              f"{sc['mean']:>7.0f}{sc['p10']:>7.0f}{sc['p50']:>7.0f}{sc['p90']:>7.0f}   | "
+              f"{lost:^22} | {s['survived']:>8.0%}")
+
+    game_seconds = total_steps * SIM_STEP_MS / 1000
+    print(f"{len(grid) * args.games} partidas, {total_steps} passos em {elapsed:.1f} s "
+          f"({total_steps / elapsed:.0f} passos/s, {game_seconds / elapsed:.0f}x o tempo real, "
+          f"{workers} processos)")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"args": vars(args), "results": summaries}, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Caches limitados usados pelos subsistemas de renderização"""
+
+from collections import OrderedDict
+
+import pygame
+
+class LRUCache:
+    """Cache limitado que descarta o item usado há mais tempo (LRU)"""
+
+    def __init__(self, max_items, max_bytes=None):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._items = OrderedDict()
+        self._sizes = {}
+
+    def get(self, key):
+        """Retorna o valor em cache (ou None) e o marca como recente"""
+        value = self._items.get(key)
+        if value is not None:
+            self._items.move_to_end(key)
+        return value
+
+    def put(self, key, value, nbytes=0):
+        """Armazena um valor, descartando os mais antigos se necessário"""
+        self.total_bytes += nbytes - self._sizes.get(key, 0)
+        self._items[key] = value
+        self._sizes[key] = nbytes
+        self._items.move_to_end(key)
+        while len(self._items) > 1 and (
+            len(self._items) > self.max_items
+            or (self.max_bytes is not None and self.total_bytes > self.max_bytes)
+        ):
+            old_key, _ = self._items.popitem(last=False)
+            self.total_bytes -= self._sizes.pop(old_key)
+        return value
+
+    def clear(self):
+        self._items.clear()
+        self._sizes.clear()
+        self.total_bytes = 0
+
+    def __len__(self):
+        return len(self._items)
+
+def surface_bytes(surf):
+    """Retorna a memória aproximada ocupada pelos pixels de uma superfície"""
+    return surf.get_width() * surf.get_height() * surf.get_bytesize()
+
+
+class SurfacePool:
+    """Superfícies reaproveitadas por (tamanho, transparência), com acquire/release explícitos
+
+    Quem pede uma superfície com acquire() é dono dela até devolvê-la com
+    release(); as devolvidas ficam guardadas (até `capacity`) para o próximo
+    pedido do mesmo tamanho. Reaproveitadas voltam limpas (preto ou
+    transparente). high_water é o maior número de superfícies emprestadas ao
+    mesmo tempo e allocations conta as que precisaram ser criadas.
+    """
+
+    def __init__(self, capacity=8):
+        self.capacity = capacity
+        self.in_use = 0
+        self.high_water = 0
+        self.allocations = 0
+        self._free = {}
+        self._free_count = 0
+
+    @staticmethod
+    def _key(size, flags):
+        return (tuple(size), flags & pygame.SRCALPHA)
+
+    def acquire(self, size, flags=0):
+        """Empresta uma superfície do tamanho dado (criando-a se não houver livre)"""
+        free = self._free.get(self._key(size, flags))
+        if free:
+            surf = free.pop()
+            self._free_count -= 1
+            surf.set_alpha(None)
+            surf.fill((0, 0, 0, 0))
+        else:
+            surf = pygame.Surface(size, flags)
+            self.allocations += 1
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return surf
+
+    def release(self, surf):
+        """Devolve uma superfície emprestada; ela não deve mais ser usada por quem a devolveu"""
+        self.in_use -= 1
+        if self._free_count < self.capacity:
+            self._free.setdefault(self._key(surf.get_size(), surf.get_flags()), []).append(surf)
+            self._free_count += 1
+
+    def stats(self):
+        return {"in_use": self.in_use, "free": self._free_count,
+                "high_water": self.high_water, "allocations": self.allocations}
+
+surface_pool = SurfacePool()
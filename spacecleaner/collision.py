@@ -0,0 +1,96 @@
+"""Sistema de colisões: grade uniforme (fase ampla), Rects (pré-teste) e máscaras por pixel"""
+
+import numpy as np
+import pygame
+
+# Lado de cada célula da grade (maior que o maior inimigo)
+COLLISION_CELL = 128
+# Com menos caixas que isto a fase ampla é pulada: testar todas com
+# collidelistall custa menos que montar e consultar a grade
+GRID_MIN_BOXES = 32
+
+class SpatialHash:
+    """Grade uniforme que indexa caixas por célula para a fase ampla das colisões"""
+    
+    def __init__(self, cell_size=COLLISION_CELL):
+        self.cell_size = cell_size
+        self._keys = np.zeros(0, np.int64)
+        self._items = np.zeros(0, np.int64)
+
+    def _cell_key(self, gx, gy):
+        # Deslocamento mantém positivas as células logo fora da tela
+        return (gy + 1024) * 4096 + (gx + 1024)
+
+    def rebuild(self, x, y, w, h):
+        """Reindexa todas as caixas (arrays x, y, w, h) de uma só vez"""
+        cell = self.cell_size
+        gx0 = np.floor_divide(x, cell).astype(np.int64)
+        gy0 = np.floor_divide(y, cell).astype(np.int64)
+        span_x = np.floor_divide(x + w, cell).astype(np.int64) - gx0 + 1
+        span_y = np.floor_divide(y + h, cell).astype(np.int64) - gy0 + 1
+        
+        # Uma entrada por (caixa, célula coberta), ordenada pela chave da célula
+        counts = span_x * span_y
+        items = np.repeat(np.arange(len(x)), counts)
+        local = np.arange(len(items)) - np.repeat(np.cumsum(counts) - counts, counts)
+        cols = np.repeat(span_x, counts)
+        keys = self._cell_key(gx0[items] + local % cols, gy0[items] + local // cols)
+        
+        order = np.argsort(keys, kind="stable")
+        self._keys = keys[order]
+        self._items = items[order]
+
+    def query(self, rect):
+        """Retorna, em ordem, os índices das caixas nas células tocadas pelo retângulo"""
+        cell = self.cell_size
+        gx = np.arange(rect.left // cell, (rect.right - 1) // cell + 1)
+        gy = np.arange(rect.top // cell, (rect.bottom - 1) // cell + 1)
+        keys = self._cell_key(gx[None, :], gy[:, None]).ravel()
+        
+        lo = np.searchsorted(self._keys, keys, "left")
+        hi = np.searchsorted(self._keys, keys, "right")
+        if not (hi - lo).any():
+            return []
+        return np.unique(np.concatenate([
+            self._items[a:b] for a, b in zip(lo.tolist(), hi.tolist()) if b > a
+        ])).tolist()
+
+class RectPool:
+    """Rects pré-alocados, atualizados no lugar a cada passo em vez de recriados"""
+    
+    def __init__(self, capacity=256):
+        self.rects = [pygame.Rect(0, 0, 0, 0) for _ in range(capacity)]
+        self.high_water = 0
+
+    def acquire(self, n):
+        """Garante n Rects e retorna a lista (só os n primeiros valem, até o próximo acquire)"""
+        missing = n - len(self.rects)
+        if missing > 0:
+            self.rects.extend(pygame.Rect(0, 0, 0, 0) for _ in range(missing))
+        if n > self.high_water:
+            self.high_water = n
+        return self.rects
+
+def hitbox_rects(x, y, size, pool):
+    """Preenche Rects do pool com as caixas dos inimigos (pré-teste das máscaras)"""
+    rects = pool.acquire(len(x))
+    for rect, left, top, s in zip(rects, x.tolist(), y.tolist(), size.tolist()):
+        rect.update(left, top, s, s)
+    return rects[:len(x)]
+
+def collide_rect(rect, grid, boxes):
+    """Pré-teste: índices das caixas candidatas que colidem com o retângulo
+
+    Sem grade (None), testa todas as caixas; o resultado é o mesmo, em ordem.
+    """
+    if grid is None:
+        return rect.collidelistall(boxes)
+    candidates = grid.query(rect)
+    if not candidates:
+        return []
+    hits = rect.collidelistall([boxes[i] for i in candidates])
+    return [candidates[i] for i in hits]
+
+def masks_overlap(mask_a, pos_a, mask_b, pos_b):
+    """Teste por pixel: indica se as máscaras se sobrepõem nas posições lógicas dadas"""
+    return mask_a.overlap(mask_b, (pos_b[0] - pos_a[0], pos_b[1] - pos_a[1])) is not None
@@ -0,0 +1,45 @@
+"""Configurações globais do jogo"""
+
+import os
+
+# Dimensões lógicas: toda a jogabilidade usa estas unidades, qualquer que
+# seja a resolução da janela ou da renderização
+WIDTH, HEIGHT = 1920, 1080
+CAPTION = 'Parallax - Spaceship Arcade 2.5D'
+
+# Tamanho da janela e escala da resolução interna de renderização em relação
+# às unidades lógicas (0.5 = 960x540, ampliado para a janela)
+WINDOW_SIZE = (WIDTH, HEIGHT)
+RENDER_SCALE = 1.0
+RENDER_SMOOTH = False
+
+# Passo fixo da simulação e taxa de quadros da tela (0 = sem limite)
+SIM_HZ = 60
+SIM_STEP_MS = 1000 / SIM_HZ
+MAX_FRAME_MS = 250
+TARGET_FPS = 60
+
+# Meta de tempo entre o início do processo e o primeiro frame (ms)
+FIRST_FRAME_TARGET_MS = 500
+
+# Parâmetros de gameplay
+spawn_margin = 100
+difficulty_step = 100
+# Aumento da velocidade dos inimigos a cada difficulty_step pontos
+speed_step = 0.25
+ship_margin = 185
+
+# Banco de recordes e sessões (ver scores.py)
+SCORES_FILE = os.path.join(os.path.expanduser("~"), ".spacecleaner", "scores.db")
+
+# Duração das transições (ms)
+FADE_DURATION = 500
+
+# Paleta de cores
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+RED = (200, 50, 50)
+YELLOW = (255, 255, 0)
+GRAY = (50, 50, 50)
+CYAN = (0, 255, 255)
+PURPLE = (160, 80, 255)
@@ -0,0 +1,86 @@
+"""Renderização por retângulos sujos para as telas estáticas (menus)"""
+
+import pygame
+
+from . import display
+
+class DirtyRenderer:
+    """Lista de exibição que redesenha só as regiões alteradas desde o frame anterior
+
+    Cada tela descreve o frame como itens (retângulo, chave, desenho). A chave
+    identifica a aparência do item: a própria superfície num blit, ou uma tupla
+    qualquer num desenho feito por função. Itens que surgiram, sumiram, mudaram
+    de chave ou de posição sujam seus retângulos; neles o fundo é restaurado e
+    todos os itens que os tocam são redesenhados com clipping.
+    """
+
+    def __init__(self):
+        self.background = None
+        self.items = []
+        self._screen_id = None
+        # Assinaturas do último frame desenhado (None = tela inteira inválida)
+        self._previous = None
+
+    def invalidate(self):
+        """Força um redesenho completo no próximo frame"""
+        self._previous = None
+
+    def begin(self, screen_id, background):
+        """Começa a descrever um frame da tela dada"""
+        if screen_id != self._screen_id or background is not self.background:
+            self.invalidate()
+        self._screen_id = screen_id
+        self.background = background
+        self.items = []
+
+    def blit(self, surf, pos):
+        """Adiciona uma superfície na posição dada"""
+        self.items.append((surf.get_rect(topleft=pos), surf, None))
+
+    def shape(self, rect, key, draw):
+        """Adiciona um desenho feito por draw(screen), contido em rect"""
+        self.items.append((pygame.Rect(rect), key, draw))
+
+    def render(self):
+        """Desenha o frame e retorna as regiões alteradas (None = tela inteira)"""
+        screen = display.screen
+        current = {(tuple(rect), key) for rect, key, _ in self.items}
+
+        if self._previous is None:
+            screen.blit(self.background, (0, 0))
+            for item in self.items:
+                self._draw(screen, item)
+            dirty = None
+        else:
+            changed = current.symmetric_difference(self._previous)
+            dirty = merge_rects(pygame.Rect(rect) for rect, _ in changed)
+            for region in dirty:
+                screen.set_clip(region)
+                screen.blit(self.background, region, region)
+                for item in self.items:
+                    if item[0].colliderect(region):
+                        self._draw(screen, item)
+            screen.set_clip(None)
+
+        self._previous = current
+        return dirty
+
+    @staticmethod
+    def _draw(screen, item):
+        rect, key, draw = item
+        if draw is None:
+            screen.blit(key, rect)
+        else:
+            draw(screen)
+
+def merge_rects(rects):
+    """Une retângulos sobrepostos para não redesenhar a mesma área duas vezes"""
+    merged = []
+    for rect in rects:
+        # Cada união pode passar a tocar retângulos já aceitos
+        i = rect.collidelist(merged)
+        while i != -1:
+            rect = rect.union(merged.pop(i))
+            i = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
@@ -0,0 +1,96 @@
+"""Janela do jogo, alvo de renderização e relógio, criados apenas quando o jogo inicia
+
+O jogo desenha em `screen`, na resolução interna (unidades lógicas vezes
+`scale`). Quando ela difere da janela, present() amplia o quadro para a
+janela; caso contrário `screen` é a própria janela e nada é copiado.
+"""
+
+import math
+
+import pygame
+
+from .cache import surface_pool
+from .config import CAPTION, HEIGHT, RENDER_SCALE, RENDER_SMOOTH, WIDTH, WINDOW_SIZE
+
+window = None
+screen = None
+clock = None
+
+# Pixels do alvo de renderização por unidade lógica
+scale = 1.0
+
+def init(render_scale=RENDER_SCALE, window_size=WINDOW_SIZE):
+    """Inicializa o pygame e abre a janela (chamadas repetidas não fazem nada)"""
+    global window, clock
+    if window is None:
+        pygame.init()
+        window = pygame.display.set_mode(window_size)
+        pygame.display.set_caption(CAPTION)
+        clock = pygame.time.Clock()
+        set_render_scale(render_scale)
+    return screen
+
+def set_render_scale(render_scale):
+    """Define a resolução interna como fração das unidades lógicas"""
+    global screen, scale
+    size = (max(1, round(WIDTH * render_scale)), max(1, round(HEIGHT * render_scale)))
+    if screen is not None and screen is not window and screen.get_size() != size:
+        surface_pool.release(screen)
+        screen = None
+    if size == window.get_size():
+        screen = window
+    elif screen is None or screen is window:
+        screen = surface_pool.acquire(size)
+    scale = size[0] / WIDTH
+    return screen
+
+def px(value):
+    """Converte uma medida lógica para pixels do alvo de renderização"""
+    return round(value * scale)
+
+def to_px(rect):
+    """Converte um retângulo lógico para pixels do alvo de renderização"""
+    x, y, w, h = rect
+    return pygame.Rect(round(x * scale), round(y * scale), round(w * scale), round(h * scale))
+
+def _upscale(source, size, dest):
+    if RENDER_SMOOTH:
+        pygame.transform.smoothscale(source, size, dest)
+    else:
+        pygame.transform.scale(source, size, dest)
+
+def present(rects=None, overlay=None):
+    """Amplia o alvo de renderização para a janela e atualiza a tela
+
+    rects são as regiões alteradas no alvo (None = tela inteira); overlay(janela)
+    desenha por cima na resolução nativa e sempre envia a tela inteira.
+    """
+    if overlay is not None:
+        rects = None
+    
+    if screen is not window:
+        if rects is None:
+            _upscale(screen, window.get_size(), window)
+        else:
+            # Só as regiões alteradas são ampliadas, arredondadas para fora
+            fx = window.get_width() / screen.get_width()
+            fy = window.get_height() / screen.get_height()
+            bounds = screen.get_rect()
+            window_rects = []
+            for rect in rects:
+                rect = rect.clip(bounds)
+                if not rect:
+                    continue
+                x, y = int(rect.x * fx), int(rect.y * fy)
+                dest = pygame.Rect(x, y, math.ceil(rect.right * fx) - x, math.ceil(rect.bottom * fy) - y)
+                _upscale(screen.subsurface(rect), dest.size, window.subsurface(dest))
+                window_rects.append(dest)
+            rects = window_rects
+    
+    if overlay is not None:
+        overlay(window)
+    
+    if rects is None:
+        pygame.display.flip()
+    else:
+        pygame.display.update(rects)
@@ -0,0 +1,95 @@
+"""Tipos de inimigo: as regras de cada tipo ficam num objeto compartilhado, não na entidade"""
+
+import copy
+import random
+
+import numpy as np
+
+from .atlas import sprite_atlas
+
+class EnemyType:
+    """Regras de um tipo de inimigo: sorteio, tamanho, velocidade, giro e penalidade
+
+    Os inimigos em si vivem no EntityStore da partida; cada um guarda só o
+    índice do seu tipo (campo kind) e os valores sorteados no spawn.
+    """
+
+    __slots__ = ("kind", "name", "spawn_chance", "size_range", "speed", "spin_range",
+                 "escape_penalty", "scaled", "sprites")
+
+    def __init__(self, kind, name, spawn_chance, size_range, speed, spin_range,
+                 escape_penalty, scaled):
+        self.kind = kind
+        self.name = name
+        self.spawn_chance = spawn_chance
+        # Tamanho sorteado em unidades lógicas (quantizado para usar o atlas)
+        self.size_range = size_range
+        # Velocidade base, multiplicada pela velocidade do jogo
+        self.speed = speed
+        # Giro por passo em graus (None = não gira)
+        self.spin_range = spin_range
+        # Vidas perdidas quando o inimigo escapa pela esquerda
+        self.escape_penalty = escape_penalty
+        # Desenhado (e colidido, pela máscara) no tamanho sorteado (True) ou no da imagem original (False)
+        self.scaled = scaled
+        # Sprites do atlas, registrados em load_resources()
+        self.sprites = ()
+
+    def replace(self, **changes):
+        """Cópia do tipo com os campos dados alterados (o original fica intacto)"""
+        enemy_type = copy.copy(self)
+        for name, value in changes.items():
+            setattr(enemy_type, name, value)
+        return enemy_type
+
+    def roll_size(self, rng=random):
+        lo, hi = self.size_range
+        return lo if lo == hi else sprite_atlas.quantize_size(rng.randint(lo, hi))
+
+    def spawn(self, store, x, y, speed_factor, rng=random):
+        """Ocupa um slot do pool com um inimigo deste tipo e retorna seu ID"""
+        size = self.roll_size(rng)
+        sprites = self.sprites
+        sprite = rng.choice(sprites) if len(sprites) > 1 else sprites[0]
+        angle = rng.randint(0, 360)
+        spin = rng.uniform(*self.spin_range) if self.spin_range else 0
+        return store.acquire(
+            x=x,
+            y=y,
+            size=size,
+            speed=self.speed * speed_factor,
+            sprite=sprite,
+            kind=self.kind,
+            angle=angle,
+            rotation_speed=spin
+        )
+
+# Índices dos tipos, guardados no campo kind das entidades
+ASTEROID, TRASH = 0, 1
+
+# Asteroide comum: tamanho variado, sem giro
+ASTEROID_TYPE = EnemyType(ASTEROID, "asteroide", spawn_chance=0.8, size_range=(60, 120), speed=3,
+                          spin_range=None, escape_penalty=0, scaled=True)
+
+# Lixo espacial: 20% dos spawns, gira e custa uma vida se escapar
+TRASH_TYPE = EnemyType(TRASH, "lixo", spawn_chance=0.2, size_range=(65, 65), speed=4,
+                       spin_range=(2, 4), escape_penalty=1, scaled=False)
+
+# Indexado pelo campo kind das entidades
+ENEMY_TYPES = (ASTEROID_TYPE, TRASH_TYPE)
+
+def rule_arrays(enemy_types):
+    """Regras em arrays por tipo, para os laços vetorizados da partida: (penalidade, escalado)"""
+    return (np.array([t.escape_penalty for t in enemy_types], np.int32),
+            np.array([t.scaled for t in enemy_types], bool))
+
+ESCAPE_PENALTY, DRAW_SCALED = rule_arrays(ENEMY_TYPES)
+
+def choose_enemy_type(rng=random, enemy_types=ENEMY_TYPES):
+    """Sorteia o tipo do próximo inimigo pelas chances de spawn"""
+    roll = rng.random()
+    for enemy_type in enemy_types:
+        roll -= enemy_type.spawn_chance
+        if roll < 0:
+            return enemy_type
+    return enemy_types[0]
@@ -0,0 +1,131 @@
+"""Pool de entidades em estrutura de arrays (NumPy)"""
+
+import numpy as np
+
+class EntityStore:
+    """Pool de entidades em arrays NumPy paralelos, com IDs estáveis e remoção por troca
+
+    Os arrays são pré-alocados com `capacity` slots e reaproveitados: acquire()
+    ocupa um slot livre e release() o devolve, sem criar objetos por entidade.
+    Com growable=False o pool nunca realoca e acquire() retorna -1 quando está
+    cheio. high_water guarda o maior número de entidades vivas ao mesmo tempo.
+    """
+    
+    def __init__(self, fields, capacity=256, growable=True):
+        self.fields = dict(fields)
+        self.count = 0
+        self.capacity = 0
+        self.growable = growable
+        self.high_water = 0
+        self.grows = 0
+        self._data = {name: np.zeros(0, dtype) for name, dtype in self.fields.items()}
+        
+        # Tabelas de indireção: slot -> ID e ID -> slot
+        self._slot_ids = np.zeros(0, np.int32)
+        self._id_slots = np.zeros(0, np.int32)
+        self._free_ids = []
+        self._grow(capacity)
+
+    def __getattr__(self, name):
+        """Retorna a visão dos valores vivos de um campo (ex.: store.x)"""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self._data[name][:self.count]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name, value):
+        """Permite atualizações vetorizadas como store.x -= store.speed
+
+        O valor é sempre copiado para os slots vivos; visões do próprio array
+        (store.x[::-1]) funcionam porque o NumPy trata a sobreposição.
+        """
+        array = self.__dict__.get("_data", {}).get(name)
+        if array is None:
+            object.__setattr__(self, name, value)
+        else:
+            array[:self.count] = value
+
+    @property
+    def ids(self):
+        """IDs estáveis das entidades vivas, na ordem dos slots"""
+        return self._slot_ids[:self.count]
+
+    def slot_of(self, entity_id):
+        """Retorna o slot atual de um ID (-1 se a entidade não existe mais)"""
+        return int(self._id_slots[entity_id])
+
+    def acquire(self, **values):
+        """Ocupa um slot no fim dos arrays e retorna o ID da entidade (-1 se o pool está cheio)"""
+        if self.count == self.capacity:
+            if not self.growable:
+                return -1
+            self._grow(self.capacity * 2)
+            self.grows += 1
+        slot = self.count
+        for name, value in values.items():
+            self._data[name][slot] = value
+        entity_id = self._free_ids.pop()
+        self._slot_ids[slot] = entity_id
+        self._id_slots[entity_id] = slot
+        self.count += 1
+        if self.count > self.high_water:
+            self.high_water = self.count
+        return entity_id
+
+    def release(self, entity_id):
+        """Devolve uma entidade ao pool movendo a última para o seu slot (O(1))"""
+        slot = self._id_slots[entity_id]
+        last = self.count - 1
+        if slot != last:
+            for array in self._data.values():
+                array[slot] = array[last]
+            moved_id = self._slot_ids[last]
+            self._slot_ids[slot] = moved_id
+            self._id_slots[moved_id] = slot
+        self._id_slots[entity_id] = -1
+        self._free_ids.append(int(entity_id))
+        self.count = last
+
+    def release_where(self, mask):
+        """Devolve de uma vez as entidades marcadas, compactando os arrays"""
+        n = self.count
+        dead = np.flatnonzero(mask)
+        if not len(dead):
+            return
+        keep_n = n - len(dead)
+        
+        # Buracos na parte que sobra são preenchidos pelos vivos do final
+        holes = dead[dead < keep_n]
+        movers = np.flatnonzero(~mask[keep_n:]) + keep_n
+        dead_ids = self._slot_ids[dead]
+        for array in self._data.values():
+            array[holes] = array[movers]
+        self._slot_ids[holes] = self._slot_ids[movers]
+        self._id_slots[self._slot_ids[holes]] = holes
+        self._id_slots[dead_ids] = -1
+        self._free_ids.extend(dead_ids.tolist())
+        self.count = keep_n
+
+    def clear(self):
+        """Devolve todas as entidades ao pool"""
+        self._free_ids.extend(self._slot_ids[:self.count].tolist())
+        self._id_slots[self._slot_ids[:self.count]] = -1
+        self.count = 0
+
+    def stats(self):
+        """Ocupação atual, capacidade, pico de uso e número de realocações"""
+        return {"count": self.count, "capacity": self.capacity,
+                "high_water": self.high_water, "grows": self.grows}
+
+    def _grow(self, capacity):
+        old = self.capacity
+        for name, array in self._data.items():
+            grown = np.zeros(capacity, array.dtype)
+            grown[:old] = array
+            self._data[name] = grown
+        self._slot_ids = np.concatenate([self._slot_ids, np.zeros(capacity - old, np.int32)])
+        self._id_slots = np.concatenate([self._id_slots, np.full(capacity - old, -1, np.int32)])
+        self._free_ids[:0] = range(capacity - 1, old - 1, -1)
+        self.capacity = capacity
@@ -0,0 +1,511 @@
+"""Simulação e renderização da partida"""
+
+import random
+from itertools import repeat
+
+import numpy as np
+import pygame
+
+from . import display
+from .assets import assets
+from .atlas import sprite_atlas
+from .cache import surface_pool
+from .collision import (GRID_MIN_BOXES, RectPool, SpatialHash, collide_rect, hitbox_rects,
+                        masks_overlap)
+from .config import (BLACK, HEIGHT, MAX_FRAME_MS, RED, SIM_STEP_MS, WIDTH, YELLOW,
+                     difficulty_step, speed_step)
+from .enemies import ASTEROID_TYPE, ENEMY_TYPES, TRASH_TYPE, choose_enemy_type, rule_arrays
+from .entities import EntityStore
+from .laser import laser_renderer
+from .masks import mask_cache
+from .particles import engine_trail, explosion, impact, particles
+from .profiler import profiler
+from .quality import quality
+from .renderqueue import BULLETS, EFFECTS, ENEMIES, HUD, SHIP, STARS, render_queue
+from .replay import InputRecorder
+from .scores import score_store
+from .ship import SHIP_CONFIGS, Ship
+from .starfield import Starfield
+from .states import LOSE, request_state_change
+from .text import number_glyphs
+
+# =============================================================================
+# RECURSOS GRÁFICOS
+# =============================================================================
+
+# Capacidade pré-alocada dos pools (acima disso o pool cresce e conta em stats())
+BULLET_CAPACITY = 256
+ENEMY_CAPACITY = 512
+
+# Recursos compartilhados pelas partidas, preparados em load_resources() na
+# escala resource_scale, e os nomes das imagens registradas no atlas
+starfield = None
+life_icon = None
+score_icon = None
+resource_scale = None
+sprite_names = {}
+
+def load_resources():
+    """Prepara atlas, máscaras, ícones e fundo estrelado (só na primeira chamada)"""
+    global starfield
+    if starfield is not None:
+        return
+
+    ASTEROID_TYPE.sprites = tuple(add_sprite(f"asteroid{i}") for i in range(1, 4))
+    TRASH_TYPE.sprites = (add_sprite("trash"),)
+
+    # O lixo espacial gira continuamente: as máscaras de todos os ângulos
+    # ficam prontas desde o início (os quadros, em load_scaled_resources)
+    mask_cache.warm(TRASH_TYPE.sprites[0])
+
+    starfield = Starfield(scale=display.scale)
+    load_scaled_resources()
+
+    # Estrelas, rotações e laser acompanham o nível de qualidade
+    quality.on_change(apply_quality)
+
+def add_sprite(name):
+    """Registra a imagem no atlas (escala de renderização) e nas máscaras (escala lógica)"""
+    image_id = sprite_atlas.add(assets.get(name))
+    mask_cache.add(image_id, assets.get(name, scale=1.0))
+    sprite_names[image_id] = name
+    return image_id
+
+def load_scaled_resources():
+    """Prepara o que depende da escala de renderização: ícones e quadros do lixo"""
+    global life_icon, score_icon, resource_scale
+    sprite_atlas.warm(TRASH_TYPE.sprites[0])
+    life_icon = assets.get("life")
+    score_icon = assets.get("score")
+    resource_scale = display.scale
+
+def rescale_resources():
+    """Refaz os recursos já carregados na escala de renderização atual
+
+    Posições, tamanhos e máscaras são lógicos, então a partida segue igual.
+    """
+    if starfield is None or resource_scale == display.scale:
+        return
+    for image_id, name in sprite_names.items():
+        sprite_atlas.replace(image_id, assets.get(name))
+    starfield.set_scale(display.scale)
+    load_scaled_resources()
+
+def apply_quality(tier):
+    """Aplica o nível de qualidade: estrelas, passo das rotações e detalhe do laser"""
+    starfield.set_density(tier.star_density)
+    if tier.angle_step != sprite_atlas.angle_step:
+        sprite_atlas.set_angle_step(tier.angle_step)
+        sprite_atlas.warm(TRASH_TYPE.sprites[0])
+    laser_renderer.set_detail(tier.laser_detail)
+
+def queue_laser(queue, rect):
+    """Enfileira o feixe do laser (retângulo lógico) na camada dos projéteis"""
+    beam, pos = laser_renderer.item(display.to_px(rect), pygame.time.get_ticks())
+    queue.add(BULLETS, beam, pos)
+
+# =============================================================================
+# PARTIDA
+# =============================================================================
+
+class GameSession:
+    """Estado de uma partida: nave, entidades, relógio, gerador e pontuação
+
+    Com a mesma semente e as mesmas entradas por passo a simulação se repete
+    exatamente (é o que o replay usa). headless é a simulação sem janela do
+    simulador em lote: o passo pula o que é só visual e o game over apenas
+    congela a partida, sem pedir a troca de tela. Sem semente, uma é
+    sorteada; com record_to, as entradas são gravadas e salvas nesse
+    diretório quando a partida termina (end()). enemy_types substitui os
+    tipos de inimigo (cópias com outras regras, na mesma ordem de kind).
+    """
+
+    def __init__(self, ship_cfg, seed=None, record_to=None, headless=False,
+                 difficulty_step=difficulty_step, speed_step=speed_step, enemy_types=ENEMY_TYPES):
+        self.headless = headless
+        # Pontos por nível de dificuldade e aumento da velocidade por nível
+        self.difficulty_step = difficulty_step
+        self.speed_step = speed_step
+        # Tipos de inimigo e suas regras em arrays, indexados pelo campo kind
+        self.enemy_types = enemy_types
+        self.escape_penalty, self.draw_scaled = rule_arrays(enemy_types)
+
+        # Gerador da partida e índice da nave em SHIP_CONFIGS (None = sessão encerrada)
+        self.seed = random.getrandbits(32) if seed is None else seed
+        self.ship_index = SHIP_CONFIGS.index(ship_cfg)
+        self.rng = random.Random(self.seed)
+
+        # Entidades (projéteis e inimigos em pools de arrays; as regras de
+        # cada inimigo ficam no seu EnemyType, indexado pelo campo kind)
+        self.laser = None
+        self.bullets = EntityStore({"x": np.float32, "y": np.float32, "w": np.float32, "h": np.float32},
+                                   capacity=BULLET_CAPACITY)
+        self.enemies = EntityStore({
+            "x": np.float32,
+            "y": np.float32,
+            "size": np.float32,
+            "speed": np.float32,
+            "angle": np.float32,
+            "rotation_speed": np.float32,
+            "sprite": np.int16,
+            "kind": np.int8,
+        }, capacity=ENEMY_CAPACITY)
+        self.collision_grid = SpatialHash()
+
+        # Rects reaproveitados pelas colisões: caixas dos inimigos e disparos
+        self.box_pool = RectPool(ENEMY_CAPACITY)
+        self.shot_rect_pool = RectPool(BULLET_CAPACITY)
+
+        # Relógio da simulação (ms) e tempo acumulado ainda não simulado
+        self.sim_time = 0.0
+        self.sim_accumulator = 0.0
+
+        # Disparos pedidos desde o último passo, aplicados no início do próximo
+        self.fire_requests = 0
+
+        # Game over ainda não aceito (uma transição em andamento recusa o
+        # pedido; draw() repete até a troca de tela começar)
+        self.game_over_pending = False
+
+        # Estatísticas
+        self.spawn_timer = 0
+        self.score = 0
+        self.lives = 3
+        self.game_speed = 1
+
+        load_resources()
+        rescale_resources()
+        self.scale = display.scale
+        particles.clear()
+        starfield.reset(None, self.rng.getrandbits(32))
+        self.ship = Ship(**ship_cfg)
+
+        # Gravação das entradas da partida (None = desligada)
+        self.recorder = None
+        self.record_dir = record_to
+        if record_to is not None:
+            self.recorder = InputRecorder(self.seed, self.ship_index)
+
+    def rescale(self):
+        """Refaz os sprites na escala de renderização atual (a partida segue igual)"""
+        rescale_resources()
+        if self.scale != display.scale:
+            self.ship.rescale()
+            self.scale = display.scale
+
+    def save_recording(self):
+        """Salva a gravação da partida, se houver, e retorna o caminho"""
+        if self.recorder is None:
+            return None
+        path = self.recorder.save(self.record_dir, self.score, self.lives)
+        self.recorder = None
+        return path
+
+    def end(self):
+        """Encerra a sessão: salva a gravação e envia a pontuação ao placar (sem esperar o disco)"""
+        self.save_recording()
+        if self.ship_index is not None:
+            score_store.submit(self.ship_index, self.seed, self.score, max(self.lives, 0),
+                               self.sim_time / 1000)
+            self.ship_index = None
+        particles.clear()
+
+    def queue_hud(self, queue):
+        """Enfileira a interface de pontuação e vidas na camada do HUD"""
+        px = display.px
+
+        # Pontuação
+        queue.add(HUD, score_icon, (px(190), px(110)))
+        queue.extend(HUD, number_glyphs(self.score, (250, 119), 60, YELLOW))
+
+        # Vidas
+        queue.add(HUD, life_icon, (px(191), px(171)))
+        queue.extend(HUD, number_glyphs(self.lives, (250, 180), 60, RED))
+
+    # -------------------------------------------------------------------------
+    # Lógica principal do jogo
+    # -------------------------------------------------------------------------
+
+    def spawn_enemy(self):
+        """Gera um novo inimigo (asteroide ou lixo espacial) e retorna seu ID"""
+        rng = self.rng
+        vertical_margin = HEIGHT // 6
+        spawn_y = rng.randint(vertical_margin, HEIGHT - vertical_margin)
+        enemy_type = choose_enemy_type(rng, self.enemy_types)
+        enemy_id = enemy_type.spawn(self.enemies, WIDTH + 50, spawn_y, self.game_speed, rng)
+
+        # Máscara pronta no spawn: a colisão só gera máscaras se o limite de memória as descartou
+        if enemy_id != -1:
+            self.enemy_mask(self.enemies.slot_of(enemy_id))
+        return enemy_id
+
+    def enemy_mask(self, slot):
+        """Máscara de colisão do inimigo e seu canto superior esquerdo (unidades lógicas)"""
+        enemies = self.enemies
+        size = float(enemies.size[slot])
+        mask = mask_cache.get(
+            int(enemies.sprite[slot]),
+            int(size) if self.draw_scaled[enemies.kind[slot]] else None,
+            float(enemies.angle[slot])
+        )
+        w, h = mask.get_size()
+        half = size / 2
+        return mask, (round(float(enemies.x[slot]) + half) - w // 2, round(float(enemies.y[slot]) + half) - h // 2)
+
+    def fire(self):
+        """Pede um disparo, feito no início do próximo passo da simulação"""
+        self.fire_requests += 1
+
+    def apply_fire(self):
+        """Dispara com a nave atual: liga o laser ou lança um projétil"""
+        ship = self.ship
+        if ship.shoot_type == "laser":
+            ship.trigger_laser(self.sim_time)
+        elif ship.shoot_type == "bullet":
+            shot = ship.shoot(self.sim_time)
+            if shot:
+                self.bullets.acquire(x=shot.x, y=shot.y, w=shot.width, h=shot.height)
+
+    def detect_collisions(self):
+        """Resolve as colisões do passo; retorna False se o jogador perdeu
+
+        Fase ampla pela grade, pré-teste pelas caixas dos inimigos e, só para
+        quem passou nos dois, teste por pixel com as máscaras em cache.
+        """
+        bullets, enemies, ship, laser = self.bullets, self.enemies, self.ship, self.laser
+        enemy_mask = self.enemy_mask
+
+        destroyed = set()
+        if not enemies.count:
+            return True
+        boxes = hitbox_rects(enemies.x, enemies.y, enemies.size, self.box_pool)
+
+        # Fase ampla: indexa os inimigos na grade uma vez por passo (com poucos
+        # inimigos a grade não compensa e o pré-teste vê todas as caixas)
+        grid = None
+        if enemies.count >= GRID_MIN_BOXES:
+            grid = self.collision_grid
+            grid.rebuild(enemies.x, enemies.y, enemies.size, enemies.size)
+
+        # Detecção de colisão: projéteis vs inimigos
+        if bullets.count or laser:
+            bullet_count = bullets.count
+            spent = np.zeros(bullet_count, bool)
+
+            # Disparos: um Rect do pool por projétil e, por último, o laser
+            shot_rects = self.shot_rect_pool.acquire(bullet_count + 1)
+            for rect, x, y, w, h in zip(shot_rects, bullets.x.tolist(), bullets.y.tolist(),
+                                        bullets.w.tolist(), bullets.h.tolist()):
+                rect.update(x, y, w, h)
+            shot_count = bullet_count
+            if laser:
+                shot_rects[shot_count].update(laser)
+                shot_count += 1
+
+            for i in range(shot_count):
+                rect = shot_rects[i]
+                shot_mask = mask_cache.solid(rect.size)
+                for hit in collide_rect(rect, grid, boxes):
+                    if hit in destroyed or not masks_overlap(shot_mask, rect.topleft, *enemy_mask(hit)):
+                        continue
+                    # Cada projétil destrói um inimigo; o laser atravessa
+                    destroyed.add(hit)
+                    if i < bullet_count:
+                        spent[i] = True
+                    self.score += 10
+                    break
+
+            bullets.release_where(spent)
+
+        # Detecção de colisão: nave vs inimigos
+        crashed = [
+            hit for hit in collide_rect(ship.rect, grid, boxes)
+            if hit not in destroyed and masks_overlap(ship.mask, ship.rect.topleft, *enemy_mask(hit))
+        ]
+
+        if destroyed or crashed:
+            # Efeitos no centro de cada inimigo removido
+            if not self.headless:
+                for slot in destroyed:
+                    size = float(enemies.size[slot])
+                    explosion(particles, float(enemies.x[slot]) + size / 2, float(enemies.y[slot]) + size / 2, size)
+                for slot in crashed:
+                    half = float(enemies.size[slot]) / 2
+                    impact(particles, float(enemies.x[slot]) + half, float(enemies.y[slot]) + half)
+
+            removed = np.zeros(enemies.count, bool)
+            removed[list(destroyed) + crashed] = True
+            enemies.release_where(removed)
+
+        if crashed:
+            self.lives -= len(crashed)
+            if self.lives <= 0:
+                self.game_over()
+                return False
+
+        return True
+
+    def game_over(self):
+        """Fim da partida: pede a tela de game over (sem janela, a partida só congela)"""
+        if not self.headless:
+            self.game_over_pending = not request_state_change(LOSE)
+
+    def update(self, keys):
+        """Avança a simulação do jogo em um passo fixo de SIM_STEP_MS"""
+        ship, bullets, enemies = self.ship, self.bullets, self.enemies
+
+        # Após o game over a simulação congela até a troca de tela
+        if self.lives <= 0:
+            return
+
+        # Disparos pedidos entre passos usam o relógio do passo anterior
+        for _ in range(self.fire_requests):
+            self.apply_fire()
+        self.fire_requests = 0
+        self.sim_time += SIM_STEP_MS
+
+        # Movimento da nave
+        with profiler.section("nave"):
+            ship.move(keys)
+            if not self.headless:
+                engine_trail(particles, ship.rect.left + 15, ship.rect.centery)
+
+            # Sistema de disparo (o laser é único e acompanha a nave)
+            if ship.shoot_type == "laser":
+                self.laser = ship.shoot(self.sim_time)
+
+        # Atualiza posição dos projéteis e descarta os que saíram da tela
+        with profiler.section("projeteis"):
+            bullets.x += ship.bullet_speed
+            bullets.release_where(bullets.x > WIDTH)
+
+        # Anima fundo estrelado
+        if not self.headless:
+            with profiler.section("estrelas"):
+                starfield.update(self.game_speed)
+
+        # Sistema de spawn de inimigos
+        with profiler.section("spawn"):
+            self.spawn_timer += 1
+            if self.spawn_timer > 60:
+                self.spawn_timer = 0
+                self.spawn_enemy()
+
+        with profiler.section("inimigos"):
+            # Movimento e rotação dos inimigos
+            enemies.x -= enemies.speed
+            enemies.angle += enemies.rotation_speed
+            enemies.angle %= 360
+
+            # Remove inimigos fora da tela
+            escaped = enemies.x < -100
+            if escaped.any():
+                # Penalidade por deixar lixo escapar (definida no tipo)
+                self.lives -= int(self.escape_penalty[enemies.kind[escaped]].sum())
+                enemies.release_where(escaped)
+                if self.lives <= 0:
+                    self.game_over()
+                    return
+
+        with profiler.section("colisoes"):
+            if not self.detect_collisions():
+                return
+
+        # Partículas: um passo vetorizado para todas
+        if not self.headless:
+            with profiler.section("particulas"):
+                particles.update()
+
+        # Sistema de dificuldade progressiva
+        new_speed_level = 1 + (self.score // self.difficulty_step) * self.speed_step
+        if new_speed_level != self.game_speed:
+            self.game_speed = new_speed_level
+            ship.speed += 0.1
+
+    def render(self, alpha=1.0):
+        """Renderiza o jogo interpolando entre os dois últimos passos da simulação
+
+        Os sprites são enfileirados por camada (estrelas, projéteis, inimigos,
+        nave, HUD) e desenhados com uma chamada a Surface.blits por camada.
+        """
+        ship, bullets, enemies = self.ship, self.bullets, self.enemies
+
+        profiler.start("render")
+        screen = display.screen
+        scale = display.scale
+        queue = render_queue
+
+        # Fração do passo que ainda não foi simulada
+        lag = 1.0 - alpha
+
+        # Fundo estrelado
+        queue.add_batch(STARS, starfield.items(lag * self.game_speed))
+
+        # Nave do jogador
+        ship_x, ship_y = ship.draw_pos(alpha)
+        queue.add(SHIP, ship.img, (ship_x * scale, ship_y * scale))
+
+        # Projéteis: um sprite pré-renderizado (o laser acompanha a posição desenhada da nave)
+        if self.laser:
+            queue_laser(queue, self.laser.move(ship_x - ship.rect.x, ship_y - ship.rect.y))
+        bullet_xs = (bullets.x - ship.bullet_speed * lag) * scale
+        bullet_img = ship.bullet_img
+        queue.add_batch(BULLETS, zip(repeat(bullet_img), zip(bullet_xs.tolist(), (bullets.y * scale).tolist())))
+
+        # Inimigos (asteroides usam o tamanho sorteado; o lixo, a imagem original; 0 = original)
+        half = enemies.size / 2
+        center_xs = np.floor((enemies.x + enemies.speed * lag + half) * scale + 0.5).astype(np.int32)
+        center_ys = np.floor((enemies.y + half) * scale + 0.5).astype(np.int32)
+        pixel_sizes = np.where(self.draw_scaled[enemies.kind], np.rint(enemies.size * scale), 0).astype(np.int32)
+        angles = enemies.angle - enemies.rotation_speed * lag
+        frame = sprite_atlas.frame
+        enemy_items = []
+        for x, y, size, sprite, angle in zip(
+            center_xs.tolist(), center_ys.tolist(), pixel_sizes.tolist(),
+            enemies.sprite.tolist(), angles.tolist()
+        ):
+            img, half_w, half_h = frame(sprite, size or None, angle)
+            enemy_items.append((img, (x - half_w, y - half_h)))
+        queue.extend(ENEMIES, enemy_items)
+
+        # Efeitos (explosões, impactos e rastro do motor)
+        queue.add_batch(EFFECTS, particles.items(scale, lag))
+
+        profiler.stop("render")
+
+        # HUD
+        with profiler.section("hud"):
+            self.queue_hud(queue)
+
+        with profiler.section("blits"):
+            screen.fill(BLACK)
+            queue.flush(screen)
+
+        # O limite de partículas acompanha o custo medido dos efeitos
+        particles.end_frame(queue.layer_ms[EFFECTS])
+
+    def pool_stats(self):
+        """Ocupação e picos de uso dos pools de entidades, Rects e superfícies"""
+        return {
+            "bullets": self.bullets.stats(),
+            "enemies": self.enemies.stats(),
+            "rects": {"boxes": self.box_pool.high_water, "shots": self.shot_rect_pool.high_water},
+            "masks_kb": mask_cache.total_bytes / 1024,
+            "particles": particles.stats(),
+            "surfaces": surface_pool.stats(),
+        }
+
+    def draw(self, keys, dt=SIM_STEP_MS):
+        """Simula os passos fixos acumulados em dt (ms) e renderiza o quadro"""
+        # Game over recusado por uma transição em andamento: pede de novo
+        if self.game_over_pending:
+            self.game_over()
+
+        self.sim_accumulator += min(dt, MAX_FRAME_MS)
+        while self.sim_accumulator >= SIM_STEP_MS:
+            if self.recorder is not None:
+                self.recorder.record(keys, self.fire_requests)
+            self.update(keys)
+            self.sim_accumulator -= SIM_STEP_MS
+
+        self.render(self.sim_accumulator / SIM_STEP_MS)
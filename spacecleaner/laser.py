@@ -0,0 +1,68 @@
+"""Renderização do feixe do laser com gradiente e quadros em cache"""
+
+import math
+
+import numpy as np
+import pygame
+
+from .cache import LRUCache
+
+# Cores do gradiente (centro -> borda) e animação opcional do feixe
+LASER_CENTER = (180, 80, 255, 200)
+LASER_EDGE = (0, 255, 255, 100)
+LASER_FRAMES = 8
+LASER_FRAME_MS = 40
+LASER_FLICKER = 0.0
+LASER_PULSE = 0
+
+class LaserRenderer:
+    """Feixe do laser com gradiente gerado uma vez e quadros animados em cache"""
+    
+    def __init__(self, frames=LASER_FRAMES, flicker=LASER_FLICKER, pulse=LASER_PULSE):
+        self.frames = frames
+        self.flicker = flicker
+        self.pulse = pulse
+        # Linhas do gradiente (None = uma por pixel, com animação)
+        self.detail = None
+        self._cache = LRUCache(frames * 4)
+
+    def set_detail(self, detail):
+        """Define as linhas do gradiente; com detalhe reduzido o feixe não é animado"""
+        if detail != self.detail:
+            self.detail = detail
+            self._cache.clear()
+
+    def build(self, width, height, alpha_scale=1.0):
+        """Gera o feixe a partir de uma faixa de 1 px preenchida via surfarray"""
+        rows = height if self.detail is None else max(1, min(self.detail, height))
+        t = np.arange(rows, dtype=np.float64)[:, None] / rows
+        center = np.array(LASER_CENTER, np.float64)
+        edge = np.array(LASER_EDGE, np.float64)
+        rgba = (center * (1 - t) + edge * t).astype(np.uint8)
+        rgba[:, 3] = (rgba[:, 3] * alpha_scale).astype(np.uint8)
+        
+        strip = pygame.Surface((1, rows), pygame.SRCALPHA)
+        pygame.surfarray.pixels3d(strip)[0] = rgba[:, :3]
+        pygame.surfarray.pixels_alpha(strip)[0] = rgba[:, 3]
+        return pygame.transform.scale(strip, (width, height))
+
+    def frame(self, width, height, ticks=0):
+        """Retorna o quadro do feixe para o instante dado (ms)"""
+        index = 0
+        if (self.flicker or self.pulse) and self.detail is None:
+            index = ticks // LASER_FRAME_MS % self.frames
+        key = (width, height, index)
+        surf = self._cache.get(key)
+        if surf is None:
+            wave = math.sin(math.tau * index / self.frames)
+            alpha_scale = 1.0 - self.flicker * (0.5 + 0.5 * wave)
+            beam_height = max(1, height + round(self.pulse * wave))
+            surf = self._cache.put(key, self.build(width, beam_height, alpha_scale))
+        return surf
+
+    def item(self, rect, ticks=0):
+        """Par (feixe, posição) centralizado verticalmente no retângulo do laser"""
+        beam = self.frame(rect.width, rect.height, ticks)
+        return beam, (rect.x, rect.centery - beam.get_height() // 2)
+
+laser_renderer = LaserRenderer()
@@ -0,0 +1,77 @@
+"""Máscaras de colisão por pixel, em cache por (imagem, tamanho, ângulo quantizado)"""
+
+import pygame
+
+from .atlas import ANGLE_STEP
+from .cache import LRUCache
+
+# Limite de memória das máscaras (as descartadas são refeitas quando preciso)
+MASK_CACHE_BYTES = 4 * 1024 * 1024
+
+def mask_bytes(mask):
+    """Memória aproximada de uma máscara (1 bit por pixel)"""
+    w, h = mask.get_size()
+    return (w * h + 7) // 8
+
+class MaskCache:
+    """Máscaras em unidades lógicas, geradas das imagens na resolução lógica
+
+    Cada imagem do atlas é registrada também aqui, em tamanho lógico, e a
+    máscara sai dela escalada e rotacionada como o quadro desenhado. O passo
+    das rotações é fixo: a colisão não muda com a resolução de renderização
+    nem com o passo de rotação do desenho (níveis de qualidade), e uma
+    partida gravada se repete em qualquer máquina.
+    """
+
+    def __init__(self, angle_step=ANGLE_STEP, max_bytes=MASK_CACHE_BYTES):
+        self.angle_step = angle_step
+        self.angle_count = 360 // angle_step
+        self._images = {}
+        self._masks = LRUCache(1 << 16, max_bytes=max_bytes)
+        self._solid = {}
+
+    def add(self, image_id, img):
+        """Registra a imagem lógica do identificador do atlas"""
+        self._images[image_id] = img
+
+    def get(self, image_id, size=None, angle=0):
+        """Máscara da imagem no tamanho lógico dado (None = original) e no ângulo quantizado"""
+        step = round(angle / self.angle_step) % self.angle_count
+        key = (image_id, size, step)
+        mask = self._masks.get(key)
+        if mask is None:
+            mask = self._build(image_id, size, step)
+            self._masks.put(key, mask, mask_bytes(mask))
+        return mask
+
+    def warm(self, image_id, sizes=(None,)):
+        """Pré-calcula as máscaras de todos os ângulos nos tamanhos dados"""
+        for size in sizes:
+            for step in range(self.angle_count):
+                self.get(image_id, size, step * self.angle_step)
+
+    def solid(self, size):
+        """Máscara totalmente preenchida (projéteis e laser)"""
+        mask = self._solid.get(size)
+        if mask is None:
+            mask = self._solid[size] = pygame.mask.Mask(size, fill=True)
+        return mask
+
+    @property
+    def total_bytes(self):
+        return self._masks.total_bytes
+
+    def _build(self, image_id, size, step):
+        img = self._images[image_id]
+        if size is not None:
+            img = pygame.transform.scale(img, (size, size))
+        if step:
+            img = pygame.transform.rotate(img, step * self.angle_step)
+        return pygame.mask.from_surface(img)
+
+def surface_mask(surf, size):
+    """Máscara de uma superfície da tela reamostrada para o tamanho lógico dado"""
+    mask = pygame.mask.from_surface(surf)
+    return mask if mask.get_size() == tuple(size) else mask.scale(size)
+
+mask_cache = MaskCache()
@@ -0,0 +1,198 @@
+"""Sistema de partículas vetorizado (explosões, impactos e rastro do motor)"""
+
+from time import perf_counter
+
+import numpy as np
+import pygame
+
+from .config import BLACK
+
+# Limite rígido de partículas vivas e orçamento de tempo por frame (ms)
+PARTICLE_CAP = 2048
+PARTICLE_BUDGET_MS = 1.5
+# Nunca reduz o limite abaixo disto, para os efeitos não sumirem de vez
+PARTICLE_MIN_LIMIT = 128
+# Peso de cada frame na média móvel do custo
+PARTICLE_SMOOTHING = 0.1
+
+# Níveis de tamanho do sprite: a partícula encolhe conforme a vida acaba
+PARTICLE_LEVELS = 4
+PARTICLE_RADIUS = 4
+
+# Paletas dos emissores
+DEBRIS_COLORS = ((170, 170, 170), (255, 170, 60), (255, 230, 120))
+IMPACT_COLORS = ((255, 60, 40), (255, 160, 40), (255, 255, 200))
+ENGINE_COLORS = ((120, 200, 255), (60, 120, 255))
+PALETTE = DEBRIS_COLORS + IMPACT_COLORS + ENGINE_COLORS
+DEBRIS, IMPACT, ENGINE = 0, len(DEBRIS_COLORS), len(DEBRIS_COLORS) + len(IMPACT_COLORS)
+
+# Colunas do array de partículas
+X, Y, VX, VY, LIFE, MAX_LIFE, COLOR = range(7)
+
+class ParticleSystem:
+    """Partículas num único array NumPy, mantidas em ordem de emissão
+
+    As vivas ficam compactadas no início do array, da mais antiga para a mais
+    nova. Ao passar do limite, as mais antigas são recicladas. O limite se
+    ajusta ao custo medido de atualizar e desenhar, para os efeitos caberem
+    no orçamento do frame. Posições e velocidades estão em unidades lógicas
+    por passo da simulação. O sorteio usa um gerador próprio, então os
+    efeitos não interferem na semente da partida.
+    """
+
+    def __init__(self, capacity=PARTICLE_CAP, budget_ms=PARTICLE_BUDGET_MS):
+        self.capacity = capacity
+        self.limit = capacity
+        self.budget_ms = budget_ms
+        self.enabled = True
+        self.count = 0
+        self.recycled = 0
+        self.data = np.zeros((capacity, 7), np.float32)
+        self.rng = np.random.default_rng()
+        self._sprites = None
+        self._offsets = None
+        self._scale = None
+        self._cost_ms = 0.0
+        # Custo médio por frame (ms)
+        self.cost_ms = 0.0
+
+    def clear(self):
+        self.count = 0
+
+    def set_limit(self, limit):
+        """Limita as partículas vivas (entre o mínimo e a capacidade)"""
+        self.limit = max(PARTICLE_MIN_LIMIT, min(int(limit), self.capacity))
+        if self.count > self.limit:
+            self._drop_oldest(self.count - self.limit)
+
+    def _drop_oldest(self, n):
+        data = self.data
+        data[:self.count - n] = data[n:self.count]
+        self.count -= n
+        self.recycled += n
+
+    def emit(self, x, y, n, speed, life, colors, direction=None, spread=np.pi):
+        """Emite n partículas em (x, y) com velocidades e vidas (passos) sorteadas nos intervalos
+
+        direction (radianos) restringe as direções a um leque de ±spread.
+        """
+        if not self.enabled or n <= 0:
+            return
+        n = min(n, self.limit)
+        if self.count + n > self.limit:
+            self._drop_oldest(self.count + n - self.limit)
+
+        rng = self.rng
+        if direction is None:
+            angle = rng.uniform(0, 2 * np.pi, n)
+        else:
+            angle = direction + rng.uniform(-spread, spread, n)
+        velocity = rng.uniform(speed[0], speed[1], n)
+        lifetime = rng.uniform(life[0], life[1], n)
+
+        rows = self.data[self.count:self.count + n]
+        rows[:, X] = x
+        rows[:, Y] = y
+        rows[:, VX] = np.cos(angle) * velocity
+        rows[:, VY] = np.sin(angle) * velocity
+        rows[:, LIFE] = lifetime
+        rows[:, MAX_LIFE] = lifetime
+        rows[:, COLOR] = rng.integers(colors[0], colors[1], n)
+        self.count += n
+
+    def update(self):
+        """Avança todas as partículas um passo e descarta as que acabaram"""
+        if not self.count:
+            return
+        start = perf_counter()
+        live = self.data[:self.count]
+        live[:, X] += live[:, VX]
+        live[:, Y] += live[:, VY]
+        live[:, VX] *= 0.96
+        live[:, VY] *= 0.96
+        live[:, LIFE] -= 1
+
+        # Compacta mantendo a ordem de emissão
+        alive = live[:, LIFE] > 0
+        if not alive.all():
+            kept = live[alive]
+            self.count = len(kept)
+            self.data[:self.count] = kept
+        self._cost_ms += (perf_counter() - start) * 1000
+
+    def _build_sprites(self, scale):
+        # Um círculo por cor e nível de tamanho, com centro pré-calculado
+        sprites, offsets = [], []
+        for color in PALETTE:
+            for level in range(1, PARTICLE_LEVELS + 1):
+                radius = max(1, round(PARTICLE_RADIUS * scale * level / PARTICLE_LEVELS))
+                sprite = pygame.Surface((radius * 2, radius * 2))
+                sprite.set_colorkey(BLACK, pygame.RLEACCEL)
+                pygame.draw.circle(sprite, color, (radius, radius), radius)
+                sprites.append(sprite.convert())
+                offsets.append(radius)
+        self._sprites = sprites
+        self._offsets = np.array(offsets, np.float32)
+        self._scale = scale
+
+    def items(self, scale, lag=0.0):
+        """Iterador de pares (sprite, posição) das partículas vivas, para Surface.blits"""
+        if not self.count:
+            return iter(())
+        start = perf_counter()
+        if self._scale != scale:
+            self._build_sprites(scale)
+
+        live = self.data[:self.count]
+        fraction = live[:, LIFE] / live[:, MAX_LIFE]
+        level = np.minimum((fraction * PARTICLE_LEVELS).astype(np.int32), PARTICLE_LEVELS - 1)
+        index = live[:, COLOR].astype(np.int32) * PARTICLE_LEVELS + level
+        offset = self._offsets[index]
+        xs = ((live[:, X] - live[:, VX] * lag) * scale - offset).tolist()
+        ys = ((live[:, Y] - live[:, VY] * lag) * scale - offset).tolist()
+        sprites = self._sprites
+        items = zip([sprites[i] for i in index.tolist()], zip(xs, ys))
+        self._cost_ms += (perf_counter() - start) * 1000
+        return items
+
+    def end_frame(self, blit_ms=0.0):
+        """Ajusta o limite pelo custo do frame (atualização, preparo e blits)
+
+        Usa a média móvel do custo, para um frame isolado lento (coleta de
+        lixo, troca de contexto) não derrubar o limite.
+        """
+        cost = self._cost_ms + blit_ms
+        self._cost_ms = 0.0
+        self.cost_ms += (cost - self.cost_ms) * PARTICLE_SMOOTHING
+        if self.cost_ms > self.budget_ms:
+            # Acima do orçamento: corta na proporção do excesso (as mais antigas saem já)
+            self.set_limit(self.count * self.budget_ms / self.cost_ms)
+            self.cost_ms = self.budget_ms
+        elif (self.limit < self.capacity and self.count >= self.limit * 0.9
+              and self.cost_ms < self.budget_ms * 0.6):
+            # Folga com o limite cheio: devolve aos poucos
+            self.set_limit(self.limit * 1.1)
+
+    def stats(self):
+        return {"count": self.count, "limit": self.limit, "capacity": self.capacity,
+                "recycled": self.recycled, "cost_ms": self.cost_ms}
+
+# =============================================================================
+# EMISSORES
+# =============================================================================
+
+def explosion(system, x, y, size):
+    """Destroços de um inimigo destruído, proporcionais ao tamanho"""
+    system.emit(x, y, 10 + int(size) // 6, speed=(1.0, 6.0), life=(20, 45),
+                colors=(DEBRIS, IMPACT))
+
+def impact(system, x, y):
+    """Estilhaços da nave atingida"""
+    system.emit(x, y, 40, speed=(2.0, 9.0), life=(25, 55), colors=(IMPACT, ENGINE))
+
+def engine_trail(system, x, y):
+    """Rastro do motor, saindo para trás da nave"""
+    system.emit(x, y, 2, speed=(3.0, 6.0), life=(8, 16), colors=(ENGINE, len(PALETTE)),
+                direction=np.pi, spread=0.25)
+
+particles = ParticleSystem()
@@ -0,0 +1,152 @@
+"""Profiler de frames com percentis móveis, overlay e exportação de trace"""
+
+import csv
+import json
+import os
+from collections import deque
+from time import perf_counter, strftime
+
+import pygame
+
+from .cache import surface_pool
+from .config import CYAN, WHITE
+from .text import get_font
+
+# Janela dos percentis, frames guardados para exportação e atualização do overlay
+PROFILE_WINDOW = 300
+PROFILE_TRACE_FRAMES = 3600
+PROFILE_OVERLAY_REFRESH = 15
+
+def percentile(values, q):
+    """Percentil q (0-100) de uma lista ordenada, com interpolação linear"""
+    pos = (len(values) - 1) * q / 100
+    lo = int(pos)
+    hi = min(lo + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (pos - lo)
+
+class _ProfileSection:
+    """Gerenciador de contexto reutilizável que cronometra uma fase"""
+    
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = perf_counter()
+
+    def __exit__(self, *exc):
+        self.profiler.add(self.name, (perf_counter() - self.start) * 1000)
+
+class FrameProfiler:
+    """Cronometra as fases de cada frame e mantém percentis móveis (ms)"""
+    
+    def __init__(self, window=PROFILE_WINDOW, trace_frames=PROFILE_TRACE_FRAMES):
+        self.window = window
+        self.show_overlay = False
+        self.frame_count = 0
+        self.first_frame_ms = None
+        self.samples = {"frame": deque(maxlen=window)}
+        self.trace = deque(maxlen=trace_frames)
+        self._sections = {}
+        self._current = {}
+        self._frame_start = 0.0
+        self._overlay = None
+
+    def section(self, name):
+        """Retorna o cronômetro da fase (use com 'with')"""
+        section = self._sections.get(name)
+        if section is None:
+            section = self._sections[name] = _ProfileSection(self, name)
+            self.samples[name] = deque(maxlen=self.window)
+        return section
+
+    def start(self, name):
+        self.section(name).__enter__()
+
+    def stop(self, name):
+        self._sections[name].__exit__()
+
+    def add(self, name, ms):
+        """Soma um tempo à fase no frame atual (várias chamadas acumulam)"""
+        self._current[name] = self._current.get(name, 0.0) + ms
+
+    def begin_frame(self):
+        self._current = {}
+        self._frame_start = perf_counter()
+
+    def end_frame(self):
+        """Fecha o frame, registrando o total e cada fase nas janelas móveis"""
+        total = (perf_counter() - self._frame_start) * 1000
+        current = self._current
+        current["frame"] = total
+        for name, samples in self.samples.items():
+            samples.append(current.get(name, 0.0))
+        self.trace.append(current)
+        self.frame_count += 1
+
+    def percentiles(self, name):
+        """Retorna (p50, p95, p99) da fase na janela móvel"""
+        samples = self.samples.get(name)
+        if not samples:
+            return (0.0, 0.0, 0.0)
+        values = sorted(samples)
+        return tuple(percentile(values, q) for q in (50, 95, 99))
+
+    def summary(self):
+        return {name: dict(zip(("p50", "p95", "p99"), self.percentiles(name)))
+                for name in self.samples}
+
+    def export(self, path):
+        """Exporta o trace de frames em CSV ou JSON (pela extensão do arquivo)"""
+        names = list(self.samples)
+        rows = [[row.get(name, 0.0) for name in names] for row in self.trace]
+        if path.endswith(".csv"):
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(names)
+                writer.writerows(rows)
+        else:
+            with open(path, "w") as f:
+                json.dump({
+                    "sections": names,
+                    "first_frame_ms": self.first_frame_ms,
+                    "summary": self.summary(),
+                    "frames": rows,
+                }, f)
+        return path
+
+    def draw_overlay(self, surface):
+        """Desenha a tabela de percentis, recalculada a cada poucos frames"""
+        if not self.show_overlay:
+            return
+        if self._overlay is None or self.frame_count % PROFILE_OVERLAY_REFRESH == 0:
+            font = get_font(28)
+            rows = [("fase", "p50", "p95", "p99")] + [
+                (name, *(f"{ms:.2f}" for ms in self.percentiles(name)))
+                for name in self.samples
+            ]
+            line_h = font.get_linesize()
+            size = (330, line_h * len(rows) + 16)
+            if self._overlay is None or self._overlay.get_size() != size:
+                if self._overlay is not None:
+                    surface_pool.release(self._overlay)
+                self._overlay = surface_pool.acquire(size, pygame.SRCALPHA)
+            self._overlay.fill((0, 0, 0, 170))
+            for i, row in enumerate(rows):
+                color = CYAN if i == 0 else WHITE
+                self._overlay.blit(font.render(row[0], True, color), (8, 8 + i * line_h))
+                for j, cell in enumerate(row[1:]):
+                    # Colunas numéricas alinhadas à direita
+                    text = font.render(cell, True, color)
+                    self._overlay.blit(text, (178 + j * 70 - text.get_width(), 8 + i * line_h))
+        surface.blit(self._overlay, (surface.get_width() - self._overlay.get_width() - 10, 10))
+
+profiler = FrameProfiler()
+
+def export_profile():
+    """Salva o trace do profiler em CSV e JSON no diretório atual"""
+    base = os.path.abspath(f"frame_trace_{strftime('%Y%m%d_%H%M%S')}")
+    return [profiler.export(base + ext) for ext in (".csv", ".json")]
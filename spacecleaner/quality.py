@@ -0,0 +1,141 @@
+"""Níveis de qualidade gráfica e o governador que os ajusta pelo tempo de frame
+
+O governador observa o tempo de trabalho de cada frame (sem a espera do
+clock.tick) numa janela móvel. Se o p90 da janela passa do limite de descida,
+cai um nível na hora; para subir, o p90 precisa ficar bem abaixo do orçamento
+por vários segundos seguidos. Depois de cada troca a janela recomeça (os
+caches refeitos no novo nível não contam) e, se uma subida é desfeita logo em
+seguida, a próxima tentativa espera o dobro.
+
+Quem depende da qualidade se registra com on_change() e recebe o QualityTier
+atual na hora e a cada troca, automática ou pedida com set_tier().
+"""
+
+from collections import deque
+
+from .config import TARGET_FPS
+from .profiler import percentile
+
+# Janela móvel (frames) e limites do p90 em relação ao orçamento do frame
+QUALITY_WINDOW = 90
+QUALITY_DOWN = 0.85
+QUALITY_UP = 0.5
+# Frames seguidos com folga antes de subir (e o teto do recuo), e frames
+# ignorados logo após uma troca
+QUALITY_UP_FRAMES = 300
+QUALITY_MAX_BACKOFF = 16
+QUALITY_COOLDOWN = 60
+
+class QualityTier:
+    """Parâmetros gráficos de um nível de qualidade"""
+
+    __slots__ = ("name", "star_density", "neon_density", "laser_detail", "angle_step", "render_scale")
+
+    def __init__(self, name, star_density, neon_density, laser_detail, angle_step, render_scale):
+        self.name = name
+        # Frações das estrelas do fundo e das camadas do contorno do título
+        # neon configuradas (STAR_COUNT ou a pedida, NEON_LAYERS)
+        self.star_density = star_density
+        self.neon_density = neon_density
+        # Linhas do gradiente do laser (None = uma por pixel, com animação)
+        self.laser_detail = laser_detail
+        # Passo das rotações pré-renderizadas (graus; só o desenho, não a colisão)
+        self.angle_step = angle_step
+        # Fração da resolução interna escolhida em --render-scale
+        self.render_scale = render_scale
+
+# Do mais leve ao mais completo; o último equivale ao jogo sem governador
+QUALITY_TIERS = (
+    QualityTier("baixa", star_density=0.33, neon_density=0.3, laser_detail=4, angle_step=15, render_scale=0.5),
+    QualityTier("media", star_density=0.67, neon_density=0.6, laser_detail=16, angle_step=10, render_scale=0.75),
+    QualityTier("alta", star_density=1.0, neon_density=1.0, laser_detail=None, angle_step=5, render_scale=1.0),
+)
+
+class QualityGovernor:
+    """Nível de qualidade atual, com ajuste automático por histerese"""
+
+    def __init__(self, tiers=QUALITY_TIERS, target_fps=TARGET_FPS or 60):
+        self.tiers = tiers
+        self.index = len(tiers) - 1
+        self.auto = True
+        self.budget_ms = 1000 / target_fps
+        self.changes = 0
+        self._window = deque(maxlen=QUALITY_WINDOW)
+        self._listeners = []
+        self._cooldown = 0
+        self._headroom_frames = 0
+        self._backoff = 1
+        self._last_up = None
+        self._frame = 0
+
+    @property
+    def tier(self):
+        return self.tiers[self.index]
+
+    def on_change(self, callback):
+        """Registra callback(tier), chamado já com o nível atual e a cada troca"""
+        self._listeners.append(callback)
+        callback(self.tier)
+
+    def set_tier(self, tier, auto=None):
+        """Troca o nível (índice ou nome); auto liga ou desliga o ajuste automático"""
+        if isinstance(tier, str):
+            tier = [t.name for t in self.tiers].index(tier)
+        if auto is not None:
+            self.auto = auto
+        self._apply(max(0, min(tier, len(self.tiers) - 1)))
+
+    def set_auto(self, enabled):
+        """Liga ou desliga o ajuste automático, mantendo o nível atual"""
+        self.auto = enabled
+        self._restart()
+
+    def observe(self, frame_ms):
+        """Registra o tempo de trabalho de um frame (ms) e ajusta o nível se preciso"""
+        self._frame += 1
+        if not self.auto:
+            return
+        if self._cooldown:
+            self._cooldown -= 1
+            return
+        window = self._window
+        window.append(frame_ms)
+        if len(window) < window.maxlen:
+            return
+
+        p90 = percentile(sorted(window), 90)
+        if p90 > self.budget_ms * QUALITY_DOWN:
+            if self.index > 0:
+                # Subida desfeita logo depois: a próxima tentativa espera mais
+                if self._last_up is not None and self._frame - self._last_up < QUALITY_UP_FRAMES * self._backoff:
+                    self._backoff = min(self._backoff * 2, QUALITY_MAX_BACKOFF)
+                self._last_up = None
+                self._apply(self.index - 1)
+            self._headroom_frames = 0
+        elif p90 < self.budget_ms * QUALITY_UP:
+            self._headroom_frames += 1
+            if self._headroom_frames >= QUALITY_UP_FRAMES * self._backoff and self.index < len(self.tiers) - 1:
+                self._last_up = self._frame
+                self._apply(self.index + 1)
+        else:
+            self._headroom_frames = 0
+
+    def stats(self):
+        return {"tier": self.tier.name, "auto": self.auto, "changes": self.changes,
+                "backoff": self._backoff}
+
+    def _restart(self):
+        self._window.clear()
+        self._headroom_frames = 0
+        self._cooldown = QUALITY_COOLDOWN
+
+    def _apply(self, index):
+        self._restart()
+        if index == self.index:
+            return
+        self.index = index
+        self.changes += 1
+        for callback in self._listeners:
+            callback(self.tier)
+
+quality = QualityGovernor()
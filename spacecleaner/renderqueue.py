@@ -0,0 +1,57 @@
+"""Fila de renderização: desenhos agrupados por camada e enviados com Surface.blits"""
+
+from itertools import chain
+from time import perf_counter
+
+# Camadas, desenhadas nesta ordem
+STARS, BULLETS, ENEMIES, EFFECTS, SHIP, HUD = range(6)
+LAYER_NAMES = ("estrelas", "projeteis", "inimigos", "efeitos", "nave", "hud")
+
+class RenderQueue:
+    """Acumula pares (superfície, posição) por camada durante o quadro
+
+    flush() envia cada camada com uma única chamada a Surface.blits, em vez
+    de um blit por sprite, e esvazia a fila para o próximo quadro. Lotes
+    grandes (estrelas, partículas) entram como iteradores consumidos só no
+    flush: o zip reaproveita a tupla de cada par e o lote não aloca um
+    objeto por sprite.
+    """
+
+    def __init__(self, layer_count=len(LAYER_NAMES)):
+        self._layers = [[] for _ in range(layer_count)]
+        self._batches = [[] for _ in range(layer_count)]
+        self.high_water = 0
+        # Tempo (ms) do último blits de cada camada
+        self.layer_ms = [0.0] * layer_count
+
+    def add(self, layer, surf, pos):
+        """Enfileira um sprite na camada dada"""
+        self._layers[layer].append((surf, pos))
+
+    def extend(self, layer, items):
+        """Enfileira vários pares (superfície, posição) na camada dada"""
+        self._layers[layer].extend(items)
+
+    def add_batch(self, layer, items):
+        """Enfileira um iterador de pares, consumido uma única vez no flush"""
+        self._batches[layer].append(items)
+
+    def __len__(self):
+        return sum(len(items) for items in self._layers)
+
+    def flush(self, surface):
+        """Desenha as camadas em ordem, uma chamada a blits por camada, e esvazia a fila"""
+        total = len(self)
+        if total > self.high_water:
+            self.high_water = total
+        for i, (items, batches) in enumerate(zip(self._layers, self._batches)):
+            if items or batches:
+                start = perf_counter()
+                surface.blits(chain(items, *batches) if batches else items, doreturn=False)
+                self.layer_ms[i] = (perf_counter() - start) * 1000
+                items.clear()
+                batches.clear()
+            else:
+                self.layer_ms[i] = 0.0
+
+render_queue = RenderQueue()
@@ -0,0 +1,171 @@
+"""
+Gravação das entradas de uma partida e reprodução determinística.
+
+O arquivo guarda a semente da partida, a nave escolhida e um byte por passo
+da simulação: direções seguradas (4 bits) e disparos pedidos desde o passo
+anterior (4 bits). No fim vão a pontuação e as vidas finais, conferidas na
+reprodução. A reprodução roda sem janela e sem limite de quadros, então uma
+sessão real vira uma carga de trabalho repetível para comparar builds.
+
+Reproduzir uma sessão gravada com --record:
+    python -m spacecleaner.replay sessao_20240101_120000.rec
+    python -m spacecleaner.replay sessao.rec --no-render
+"""
+
+import argparse
+import os
+import struct
+from time import perf_counter, strftime
+
+import pygame
+
+# Cabeçalho: assinatura, versão, índice da nave, semente e número de passos
+MAGIC = b"SCRP"
+VERSION = 1
+HEADER = struct.Struct("<4sHHQI")
+# Rodapé: pontuação e vidas ao fim da sessão
+FOOTER = struct.Struct("<ii")
+
+# Bits de direção por tecla (setas e WASD se combinam como na nave)
+KEY_BITS = {
+    pygame.K_UP: 1, pygame.K_w: 1,
+    pygame.K_DOWN: 2, pygame.K_s: 2,
+    pygame.K_LEFT: 4, pygame.K_a: 4,
+    pygame.K_RIGHT: 8, pygame.K_d: 8,
+}
+FIRE_SHIFT = 4
+MAX_FIRES = 15
+
+def key_mask(keys):
+    """Bits de direção do estado de teclado dado"""
+    mask = 0
+    for key, bit in KEY_BITS.items():
+        if keys[key]:
+            mask |= bit
+    return mask
+
+class StepKeys:
+    """Estado de teclado de um passo gravado, no formato de pygame.key.get_pressed"""
+
+    __slots__ = ("mask",)
+
+    def __init__(self, mask=0):
+        self.mask = mask
+
+    def __getitem__(self, key):
+        return bool(self.mask & KEY_BITS.get(key, 0))
+
+# =============================================================================
+# GRAVAÇÃO
+# =============================================================================
+
+class InputRecorder:
+    """Acumula as entradas de cada passo da simulação em memória"""
+
+    def __init__(self, seed, ship_index):
+        self.seed = seed
+        self.ship_index = ship_index
+        self.steps = bytearray()
+
+    def record(self, keys, fires):
+        """Registra as teclas e os disparos pedidos antes de um passo"""
+        self.steps.append(key_mask(keys) | min(fires, MAX_FIRES) << FIRE_SHIFT)
+
+    def to_bytes(self, score, lives):
+        header = HEADER.pack(MAGIC, VERSION, self.ship_index, self.seed, len(self.steps))
+        return header + bytes(self.steps) + FOOTER.pack(score, lives)
+
+    def save(self, directory, score, lives):
+        """Grava a sessão num arquivo novo no diretório dado e retorna o caminho"""
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"sessao_{strftime('%Y%m%d_%H%M%S')}.rec")
+        suffix = 1
+        while os.path.exists(path):
+            path = os.path.join(directory, f"sessao_{strftime('%Y%m%d_%H%M%S')}_{suffix}.rec")
+            suffix += 1
+        with open(path, "wb") as f:
+            f.write(self.to_bytes(score, lives))
+        return path
+
+# =============================================================================
+# REPRODUÇÃO
+# =============================================================================
+
+def load_recording(path):
+    """Lê uma sessão: (índice da nave, semente, bytes dos passos, pontuação, vidas)"""
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, version, ship_index, seed, step_count = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"gravação inválida: {path}")
+    start = HEADER.size
+    steps = data[start:start + step_count]
+    score, lives = FOOTER.unpack_from(data, start + step_count)
+    return ship_index, seed, steps, score, lives
+
+def run_replay(path, render=True):
+    """Reproduz a sessão o mais rápido possível; retorna o resumo e os tempos (ms) por passo"""
+    from . import game
+    from .profiler import percentile
+    from .ship import SHIP_CONFIGS
+
+    ship_index, seed, steps, expected_score, expected_lives = load_recording(path)
+    session = game.GameSession(SHIP_CONFIGS[ship_index], seed=seed)
+
+    keys = StepKeys()
+    times = []
+    for step in steps:
+        start = perf_counter()
+        keys.mask = step & 0xF
+        for _ in range(step >> FIRE_SHIFT):
+            session.fire()
+        session.update(keys)
+        if render:
+            session.render()
+        times.append((perf_counter() - start) * 1000)
+
+    ordered = sorted(times) or [0.0]
+    result = {
+        "steps": len(steps),
+        "seed": seed,
+        "score": session.score,
+        "lives": session.lives,
+        "expected_score": expected_score,
+        "expected_lives": expected_lives,
+        "consistent": (session.score, session.lives) == (expected_score, expected_lives),
+        "total_s": sum(times) / 1000,
+        "mean_ms": sum(times) / max(len(times), 1),
+        "p95_ms": percentile(ordered, 95),
+        "p99_ms": percentile(ordered, 99),
+    }
+    session.end()
+    return result
+
+def main():
+    # Reprodução sem janela: o driver precisa ser escolhido antes de abrir o display
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    parser = argparse.ArgumentParser(description="Reproduz uma sessão gravada do Space Cleaner")
+    parser.add_argument("path", help="arquivo .rec gravado com --record")
+    parser.add_argument("--no-render", action="store_true", help="só a simulação, sem desenhar")
+    parser.add_argument("--render-scale", type=float, default=1.0,
+                        help="resolução interna em relação a 1920x1080")
+    args = parser.parse_args()
+
+    from . import display
+    display.init(args.render_scale)
+    r = run_replay(args.path, render=not args.no_render)
+
+    print(f"{r['steps']} passos em {r['total_s']:.2f} s "
+          f"({r['steps'] / max(r['total_s'], 1e-9):.0f} passos/s, "
+          f"média {r['mean_ms']:.3f} ms, p95 {r['p95_ms']:.3f} ms, p99 {r['p99_ms']:.3f} ms)")
+    print(f"pontuação {r['score']} (gravada {r['expected_score']}), "
+          f"vidas {r['lives']} (gravadas {r['expected_lives']})")
+    if not r["consistent"]:
+        print("divergência: a reprodução não bate com a sessão gravada")
+        raise SystemExit(1)
+    print("ok: reprodução consistente")
+
+if __name__ == "__main__":
+    main()
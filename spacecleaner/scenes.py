@@ -0,0 +1,322 @@
+"""Cenas do jogo (menu, seleção, partida, pausa, game over) e a pilha que as gerencia
+
+Cada cena trata suas teclas e renderiza a si mesma, guardando a própria
+seleção e seus recursos (a lista de exibição das telas estáticas, a sessão
+da partida). A pilha acompanha o estado de states.py: ao fim de cada
+transição ela empilha, desempilha ou troca cenas, então uma cena suspensa
+(a partida durante a pausa) continua viva sem ser reconstruída.
+"""
+
+import sys
+
+import pygame
+
+from . import display, states
+from .cache import surface_pool
+from .dirty import DirtyRenderer
+from .scores import score_store
+from .screens import cols, draw_character_select, draw_lose, draw_menu, draw_pause, slots
+from .ship import ship1_cfg, ship2_cfg
+from .states import CHARACTER_SELECT, GAME, LOSE, MENU, PAUSE
+
+# Brilho do quadro congelado da partida atrás do menu de pausa
+PAUSE_DIM = 0.45
+
+def load_game_module():
+    """Importa o módulo da partida (NumPy, atlas, colisões) na primeira vez que é usado"""
+    # Import relativo comum (só adiado): o PyInstaller o segue, ao contrário do importlib
+    from . import game
+    return game
+
+def quit_game(stack):
+    """Fecha a janela e encerra o processo (registrando a partida em andamento)"""
+    stack.close()
+    score_store.close()
+    pygame.quit()
+    sys.exit()
+
+# =============================================================================
+# CENAS
+# =============================================================================
+
+class Scene:
+    """Base das cenas: entrada, renderização e ciclo de vida na pilha"""
+
+    name = None
+    # Cenas que pintam a tela inteira a cada frame (sem retângulos sujos)
+    full_redraw = False
+
+    def __init__(self, stack):
+        self.stack = stack
+        # Lista de exibição própria (só nas telas com retângulos sujos)
+        self.renderer = None if self.full_redraw else DirtyRenderer()
+
+    def invalidate(self):
+        """Força um redesenho completo no próximo frame"""
+        if self.renderer is not None:
+            self.renderer.invalidate()
+
+    def rescale(self):
+        """A escala de renderização mudou"""
+        self.invalidate()
+
+    def handle_key(self, key):
+        """Trata um KEYDOWN"""
+
+    def render(self, keys, dt, t):
+        """Desenha um frame; retorna as regiões alteradas (None = tela inteira)"""
+
+    def enter(self):
+        """Cena passou a ser o topo da pilha"""
+
+    def exit(self):
+        """Cena saiu da pilha"""
+
+    def suspend(self):
+        """Outra cena foi empilhada por cima desta"""
+
+    def resume(self):
+        """A cena de cima foi desempilhada e esta voltou ao topo"""
+
+class MenuScene(Scene):
+    """Menu principal"""
+
+    name = MENU
+
+    def __init__(self, stack):
+        super().__init__(stack)
+        self.selected = 0
+
+    def handle_key(self, key):
+        if key == pygame.K_UP:
+            self.selected = (self.selected - 1) % 2
+        elif key == pygame.K_DOWN:
+            self.selected = (self.selected + 1) % 2
+        elif key in (pygame.K_SPACE, pygame.K_RETURN):
+            if self.selected == 0:
+                self.stack.switch(CHARACTER_SELECT, "wipe")
+            else:
+                quit_game(self.stack)
+
+    def render(self, keys, dt, t):
+        return draw_menu(self.renderer, self.selected)
+
+class CharacterSelectScene(Scene):
+    """Seleção de nave"""
+
+    name = CHARACTER_SELECT
+
+    def __init__(self, stack):
+        super().__init__(stack)
+        self.selected = 0
+
+    def handle_key(self, key):
+        if key == pygame.K_RIGHT and (self.selected + 1) % cols != 0:
+            self.selected += 1
+        elif key == pygame.K_LEFT and self.selected % cols != 0:
+            self.selected -= 1
+        elif key == pygame.K_DOWN and self.selected + cols < len(slots):
+            self.selected += cols
+        elif key == pygame.K_UP and self.selected - cols >= 0:
+            self.selected -= cols
+        elif key in (pygame.K_SPACE, pygame.K_RETURN):
+            idx = slots[self.selected]["index"]
+            if idx in (1, 2):
+                self.stack.scenes[GAME].ship_cfg = ship2_cfg if idx == 1 else ship1_cfg
+                self.stack.switch(GAME)
+
+    def render(self, keys, dt, t):
+        return draw_character_select(self.renderer, self.selected, slots, t)
+
+class GameScene(Scene):
+    """Partida em andamento; ao ser suspensa guarda o último quadro congelado
+
+    A sessão (todo o estado da partida) é criada ao entrar, com a nave
+    escolhida em ship_cfg, e encerrada ao sair.
+    """
+
+    name = GAME
+    full_redraw = True
+
+    def __init__(self, stack):
+        super().__init__(stack)
+        self.ship_cfg = None
+        self.session = None
+        self.frozen = None
+
+    def enter(self):
+        game = load_game_module()
+        self.session = game.GameSession(self.ship_cfg, record_to=self.stack.record_dir)
+
+    def exit(self):
+        self.session.end()
+        self.session = None
+        self._release_frozen()
+
+    def rescale(self):
+        if self.session is not None:
+            self.session.rescale()
+
+    def suspend(self):
+        # O alvo de renderização ainda guarda o último quadro da partida
+        screen = display.screen
+        if self.frozen is None or self.frozen.get_size() != screen.get_size():
+            self._release_frozen()
+            self.frozen = surface_pool.acquire(screen.get_size())
+        self.frozen.blit(screen, (0, 0))
+        states.shade(self.frozen, PAUSE_DIM)
+
+    def resume(self):
+        self._release_frozen()
+
+    def _release_frozen(self):
+        if self.frozen is not None:
+            surface_pool.release(self.frozen)
+            self.frozen = None
+
+    def handle_key(self, key):
+        if key == pygame.K_ESCAPE:
+            self.stack.push(PAUSE, "crossfade")
+        elif key == pygame.K_SPACE:
+            self.session.fire()
+
+    def render(self, keys, dt, t):
+        self.session.draw(keys, dt)
+        return None
+
+class PauseScene(Scene):
+    """Menu de pausa, desenhado sobre o quadro congelado da partida"""
+
+    name = PAUSE
+
+    def __init__(self, stack):
+        super().__init__(stack)
+        self.selected = 0
+
+    def handle_key(self, key):
+        if key == pygame.K_UP:
+            self.selected = (self.selected - 1) % 3
+        elif key == pygame.K_DOWN:
+            self.selected = (self.selected + 1) % 3
+        elif key in (pygame.K_SPACE, pygame.K_RETURN):
+            if self.selected == 0:
+                self.stack.pop("crossfade")
+            elif self.selected == 1:
+                self.stack.switch(MENU)
+            elif self.selected == 2:
+                quit_game(self.stack)
+
+    def render(self, keys, dt, t):
+        below = self.stack.below(self)
+        return draw_pause(self.renderer, self.selected, getattr(below, "frozen", None))
+
+class LoseScene(Scene):
+    """Tela de game over"""
+
+    name = LOSE
+
+    def __init__(self, stack):
+        super().__init__(stack)
+        self.selected = 0
+
+    def handle_key(self, key):
+        if key == pygame.K_UP:
+            self.selected = (self.selected - 1) % 3
+        elif key == pygame.K_DOWN:
+            self.selected = (self.selected + 1) % 3
+        elif key in (pygame.K_RETURN, pygame.K_SPACE):
+            if self.selected == 0:
+                self.stack.switch(CHARACTER_SELECT)
+            elif self.selected == 1:
+                self.stack.switch(MENU)
+            elif self.selected == 2:
+                quit_game(self.stack)
+
+    def render(self, keys, dt, t):
+        return draw_lose(self.renderer, self.selected)
+
+# =============================================================================
+# PILHA DE CENAS
+# =============================================================================
+
+SCENE_TYPES = (MenuScene, CharacterSelectScene, GameScene, PauseScene, LoseScene)
+
+class SceneStack:
+    """Pilha de cenas sincronizada com as transições de states.py
+
+    push, pop e switch pedem a transição e guardam a operação; sync() a
+    aplica quando states.game_state passa a ser o estado de destino (no
+    início da transição para crossfade e wipe, no meio para fade). Trocas
+    pedidas direto a states.py (o game over) viram um switch.
+    """
+
+    def __init__(self, scene_types=SCENE_TYPES, record_dir=None):
+        # Diretório onde as partidas são gravadas (None = sem gravação)
+        self.record_dir = record_dir
+        # Uma instância por cena, reaproveitada entre transições
+        self.scenes = {scene_type.name: scene_type(self) for scene_type in scene_types}
+        self.stack = [self.scenes[states.game_state]]
+        self._pending = None
+        self.stack[0].enter()
+
+    @property
+    def top(self):
+        return self.stack[-1]
+
+    def below(self, scene):
+        """Cena logo abaixo da dada na pilha (None se for a base)"""
+        i = self.stack.index(scene)
+        return self.stack[i - 1] if i > 0 else None
+
+    def _request(self, op, name, kind):
+        if self._pending is None and states.request_state_change(name, kind):
+            self._pending = (op, name)
+
+    def push(self, name, kind="fade"):
+        """Empilha a cena, suspendendo a atual"""
+        self._request("push", name, kind)
+
+    def pop(self, kind="fade"):
+        """Desempilha a cena atual e retoma a de baixo"""
+        self._request("pop", self.stack[-2].name, kind)
+
+    def switch(self, name, kind="fade"):
+        """Troca toda a pilha pela cena dada"""
+        self._request("switch", name, kind)
+
+    def close(self):
+        """Tira todas as cenas da pilha (a partida em andamento é encerrada)"""
+        while self.stack:
+            self.stack.pop().exit()
+
+    def rescale(self):
+        """Avisa todas as cenas de que a escala de renderização mudou"""
+        for scene in self.scenes.values():
+            scene.rescale()
+
+    def sync(self):
+        """Aplica a operação pendente quando o estado de destino entra em vigor"""
+        name = states.game_state
+        if self._pending is not None:
+            if name != self._pending[1]:
+                return
+            op = self._pending[0]
+            self._pending = None
+        elif name != self.top.name:
+            op = "switch"
+        else:
+            return
+
+        if op == "push":
+            self.top.suspend()
+            self.stack.append(self.scenes[name])
+            self.top.enter()
+        elif op == "pop":
+            self.stack.pop().exit()
+            self.top.resume()
+        else:
+            self.close()
+            self.stack.append(self.scenes[name])
+            self.top.enter()
+        # A tela mostrava outra cena: o primeiro frame da nova é completo
+        self.top.invalidate()
@@ -0,0 +1,190 @@
+"""Recordes e estatísticas das sessões em SQLite, gravados fora da thread principal
+
+Toda a E/S de disco (abrir o banco, gravar sessões, ler o placar) roda numa
+thread própria. As sessões entram numa fila e são gravadas em lote, numa
+transação só, para o frame nunca esperar pelo disco (lento nos cartões SD
+dos gabinetes). O placar é lido só quando uma tela o pede pela primeira vez;
+até lá as telas simplesmente não o mostram.
+"""
+
+import os
+import queue
+import threading
+from time import time
+
+from .config import SCORES_FILE
+
+# Quantas sessões o placar mostra
+LEADERBOARD_SIZE = 5
+# Espera por mais sessões antes de gravar um lote (s) e tamanho máximo do lote
+WRITE_DELAY_S = 0.5
+WRITE_BATCH = 64
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    ended_at REAL NOT NULL,
+    ship INTEGER NOT NULL,
+    seed INTEGER,
+    score INTEGER NOT NULL,
+    lives INTEGER NOT NULL,
+    duration_s REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_score ON sessions (score DESC);
+"""
+
+# Pedido de leitura do placar e fim da thread, na mesma fila das gravações
+_LOAD = object()
+_STOP = object()
+
+class ScoreEntry:
+    """Uma linha do placar"""
+
+    __slots__ = ("score", "ship", "ended_at")
+
+    def __init__(self, score, ship, ended_at):
+        self.score = score
+        self.ship = ship
+        self.ended_at = ended_at
+
+class ScoreStore:
+    """Fila de sessões gravada em lote por uma thread, e o placar em memória
+
+    Sem open() o armazenamento fica desligado e submit() não faz nada (o
+    benchmark, o replay e o simulador em lote não gravam sessões).
+    """
+
+    def __init__(self):
+        self.path = None
+        self.leaderboard = None
+        self.last_entry = None
+        self.written = 0
+        self.batches = 0
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._load_requested = False
+        # Sessões enviadas depois do pedido de leitura (não entram na consulta)
+        self._late = []
+
+    @property
+    def enabled(self):
+        return self._thread is not None
+
+    def open(self, path=SCORES_FILE):
+        """Liga o armazenamento; o banco é aberto na thread de gravação"""
+        if self._thread is None:
+            self.path = path
+            self._thread = threading.Thread(target=self._run, name="score-writer", daemon=True)
+            self._thread.start()
+
+    def close(self, timeout=2.0):
+        """Grava o que estiver na fila e encerra a thread"""
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+            self._thread = None
+
+    def submit(self, ship, seed, score, lives, duration_s):
+        """Registra uma sessão encerrada (retorna na hora; a gravação vai para a fila)"""
+        if self._thread is None:
+            return
+        ended_at = time()
+        self._queue.put((ended_at, ship, seed, score, lives, duration_s))
+
+        # O placar é atualizado em memória, sem esperar o disco
+        entry = self.last_entry = ScoreEntry(score, ship, ended_at)
+        with self._lock:
+            if self.leaderboard is not None:
+                self.leaderboard = rank(self.leaderboard + (entry,))
+            elif self._load_requested:
+                self._late.append(entry)
+
+    def get_leaderboard(self):
+        """Placar em memória; pede a leitura na primeira chamada (None até chegar)"""
+        if self.leaderboard is None and not self._load_requested and self._thread is not None:
+            with self._lock:
+                self._load_requested = True
+            self._queue.put(_LOAD)
+        return self.leaderboard
+
+    # -------------------------------------------------------------------------
+    # Thread de gravação
+    # -------------------------------------------------------------------------
+
+    def _run(self):
+        # sqlite3 só é importado aqui, fora do caminho até o primeiro frame
+        import sqlite3
+        try:
+            db = self._connect()
+        except (OSError, sqlite3.Error):
+            # Sem onde gravar: o jogo segue, só sem placar
+            with self._lock:
+                self.leaderboard = ()
+            return
+        running = True
+        while running:
+            batch = []
+            item = self._queue.get()
+            # Junta o que chegar em seguida num lote só
+            while True:
+                if item is _STOP:
+                    running = False
+                elif item is _LOAD:
+                    self._write(db, batch)
+                    batch = []
+                    self._load(db)
+                else:
+                    batch.append(item)
+                if not running or len(batch) >= WRITE_BATCH:
+                    break
+                try:
+                    item = self._queue.get(timeout=WRITE_DELAY_S if batch else 0)
+                except queue.Empty:
+                    break
+            self._write(db, batch)
+        db.close()
+
+    def _connect(self):
+        import sqlite3
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        db = sqlite3.connect(self.path)
+        # WAL com sincronização normal: um fsync por checkpoint, não por transação
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.executescript(SCHEMA)
+        return db
+
+    def _write(self, db, batch):
+        import sqlite3
+        if not batch:
+            return
+        try:
+            with db:
+                db.executemany(
+                    "INSERT INTO sessions (ended_at, ship, seed, score, lives, duration_s)"
+                    " VALUES (?, ?, ?, ?, ?, ?)", batch)
+        except sqlite3.Error:
+            return
+        self.written += len(batch)
+        self.batches += 1
+
+    def _load(self, db):
+        import sqlite3
+        try:
+            rows = db.execute(
+                "SELECT score, ship, ended_at FROM sessions ORDER BY score DESC LIMIT ?",
+                (LEADERBOARD_SIZE,)).fetchall()
+        except sqlite3.Error:
+            rows = []
+        with self._lock:
+            self.leaderboard = rank([ScoreEntry(*row) for row in rows] + self._late)
+            self._late = []
+
+def rank(entries):
+    """As melhores sessões, da maior pontuação para a menor"""
+    return tuple(sorted(entries, key=lambda e: -e.score)[:LEADERBOARD_SIZE])
+
+score_store = ScoreStore()
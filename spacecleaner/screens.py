@@ -0,0 +1,193 @@
+"""Telas de menu, pausa, game over e seleção de nave
+
+Cada tela é descrita na lista de exibição (DirtyRenderer) da cena que a
+mostra, então trocar de cena não descarta o que a outra tinha desenhado.
+"""
+
+import math
+
+import pygame
+
+from . import display
+from .assets import assets, menu_background
+from .config import BLACK, GRAY, HEIGHT, WHITE, WIDTH, YELLOW
+from .scores import score_store
+from .states import CHARACTER_SELECT, LOSE, MENU, PAUSE
+from .text import create_neon_title, render_text
+
+# Tamanho das naves nos slots de seleção
+PREVIEW_SIZE = (130, 130)
+
+# Placar à direita das opções (centro da coluna e topo, unidades lógicas)
+LEADERBOARD_X = 1620
+LEADERBOARD_Y = 380
+
+# =============================================================================
+# FUNÇÕES AUXILIARES
+# =============================================================================
+
+def draw_text_center(text, font, color, y):
+    """Desenha texto centralizado horizontalmente"""
+    screen = display.screen
+    surf = font.render(text, True, color)
+    screen.blit(surf, (display.px(WIDTH // 2) - surf.get_width() // 2, display.px(y)))
+    return surf
+
+def draw_menu_options(renderer, options, selected, base_y=None, gap=100):
+    """Adiciona as opções de menu com cursor animado (posições lógicas)"""
+    px = display.px
+    if base_y is None:
+        total_height = (len(options) - 1) * gap
+        base_y = HEIGHT // 2 - total_height // 2
+    
+    # Animação de pulso do cursor (quantizada para reaproveitar o cache)
+    pulse = int(255 * (0.5 + 0.5 * math.sin(pygame.time.get_ticks() * 0.006))) & ~7
+    pulse_color = (pulse, pulse, pulse)
+    
+    for i, text in enumerate(options):
+        label = render_text(text, 90, WHITE)
+        cursor = render_text(">", 90, pulse_color if i == selected else BLACK)
+        
+        total_width = cursor.get_width() + px(25) + label.get_width()
+        x_start = px(WIDTH // 2) - total_width // 2
+        y = px(base_y + i * gap)
+        
+        renderer.blit(cursor, (x_start, y))
+        renderer.blit(label, (x_start + cursor.get_width() + px(25), y))
+
+def draw_leaderboard(renderer, entries, highlight=None):
+    """Adiciona o placar (melhores pontuações), destacando a entrada dada"""
+    px = display.px
+    center = px(LEADERBOARD_X)
+    header = render_text("RECORDES", 60, YELLOW)
+    renderer.blit(header, (center - header.get_width() // 2, px(LEADERBOARD_Y)))
+    for i, entry in enumerate(entries):
+        latest = highlight is not None and entry.ended_at == highlight.ended_at
+        line = render_text(f"{i + 1}.  {entry.score}", 50, YELLOW if latest else WHITE)
+        renderer.blit(line, (center - line.get_width() // 2, px(LEADERBOARD_Y + 80 + i * 60)))
+
+def draw_title_menu(renderer, screen_id, title, title_size, options, selected_option, background=None,
+                    leaderboard=None, highlight=None):
+    """Tela com título neon, opções e placar opcional; retorna as regiões alteradas"""
+    renderer.begin(screen_id, background or menu_background())
+    
+    # Título com efeito neon
+    title = create_neon_title(title, title_size)
+    renderer.blit(title, (display.px(WIDTH // 2) - title.get_width() // 2, display.px(200)))
+    
+    # Opções do menu
+    draw_menu_options(renderer, options, selected_option)
+    
+    # Placar (só depois que a leitura em segundo plano chegou)
+    if leaderboard:
+        draw_leaderboard(renderer, leaderboard, highlight)
+    return renderer.render()
+
+# =============================================================================
+# FUNÇÕES DE RENDERIZAÇÃO DAS TELAS
+# =============================================================================
+# Cada tela retorna os retângulos que mudaram desde o frame anterior
+# (None quando a tela inteira foi redesenhada).
+
+def draw_menu(renderer, selected_option):
+    """Renderiza a tela do menu principal"""
+    return draw_title_menu(renderer, MENU, "START", 200, ["Iniciar", "Sair"], selected_option,
+                           leaderboard=score_store.get_leaderboard())
+
+def draw_pause(renderer, selected_option, background=None):
+    """Renderiza a tela de pausa (sobre o quadro congelado da partida, se houver)"""
+    return draw_title_menu(renderer, PAUSE, "PAUSE", 180, ["Continuar", "Voltar ao Menu", "Sair"], selected_option,
+                           background)
+
+def draw_lose(renderer, selected_option):
+    """Renderiza a tela de game over, com a última sessão destacada no placar"""
+    return draw_title_menu(renderer, LOSE, "GAME OVER", 200, ["Jogar Novamente", "Voltar ao Menu", "Sair"], selected_option,
+                           leaderboard=score_store.get_leaderboard(), highlight=score_store.last_entry)
+
+def draw_banner(screen, banner_rect, glow_rect):
+    """Faixa escura com borda amarela atrás do título da seleção"""
+    px = display.px
+    pygame.draw.rect(screen, (20, 20, 20), banner_rect, border_radius=px(20))
+    pygame.draw.rect(screen, (255, 230, 0), banner_rect, max(1, px(4)), border_radius=px(20))
+    
+    # Brilho interno
+    pygame.draw.rect(screen, (255, 255, 120, 60), glow_rect, max(1, px(6)), border_radius=px(28))
+
+def draw_slot(screen, rect, idx, selected):
+    """Desenha um slot de seleção (nave disponível ou bloqueado) no retângulo em pixels"""
+    px = display.px
+    if idx in (1, 2):
+        # Slot desbloqueado
+        preview = assets.get_scaled("ship2" if idx == 1 else "ship1", PREVIEW_SIZE)
+        screen.blit(preview, (rect.x + px(10), rect.y + px(10)))
+        pygame.draw.rect(screen, WHITE, rect, max(1, px(3)))
+    else:
+        # Slot bloqueado
+        pygame.draw.rect(screen, GRAY, rect)
+        pygame.draw.rect(screen, WHITE, rect, max(1, px(2)))
+        lock_txt = render_text("???", 40, WHITE)
+        screen.blit(lock_txt, (
+            rect.centerx - lock_txt.get_width() // 2,
+            rect.centery - lock_txt.get_height() // 2
+        ))
+    
+    # Destacar slot selecionado
+    if selected:
+        pygame.draw.rect(screen, YELLOW, rect, max(1, px(6)))
+
+def draw_character_select(renderer, selected_slot, slots, t):
+    """Renderiza a tela de seleção de personagem"""
+    px = display.px
+    renderer.begin(CHARACTER_SELECT, menu_background())
+    
+    # Banner do título
+    text_surf = render_text("ESCOLHA SUA NAVE", 95, (255, 230, 0), bold=True)
+    text_rect = text_surf.get_rect(center=(px(WIDTH // 2), px(200)))
+    
+    # Fundo da faixa
+    padding_x, padding_y = px(40), px(25)
+    banner_rect = pygame.Rect(
+        text_rect.x - padding_x,
+        text_rect.y - padding_y,
+        text_rect.width + padding_x * 2,
+        text_rect.height + padding_y * 2
+    )
+    glow_rect = banner_rect.inflate(px(15), px(15))
+    renderer.shape(glow_rect, "banner", lambda screen: draw_banner(screen, banner_rect, glow_rect))
+    renderer.blit(text_surf, text_rect.topleft)
+    
+    # Slots de seleção
+    for i, slot in enumerate(slots):
+        rect, idx = display.to_px(slot["rect"]), slot["index"]
+        selected = i == selected_slot
+        renderer.shape(rect, ("slot", idx, selected),
+                       lambda screen, rect=rect, idx=idx, selected=selected: draw_slot(screen, rect, idx, selected))
+    
+    # Instruções
+    instr = render_text("Use as setas e Espaço para confirmar", 50, WHITE)
+    renderer.blit(instr, (px(WIDTH // 2) - instr.get_width() // 2, px(HEIGHT - 100)))
+    return renderer.render()
+
+# =============================================================================
+# PREPARAÇÃO DOS SLOTS DE SELEÇÃO
+# =============================================================================
+
+cols, rows = 3, 3
+slot_size, spacing = 150, 25
+total_width = cols * slot_size + (cols - 1) * spacing
+total_height = rows * slot_size + (rows - 1) * spacing
+start_x = WIDTH // 2 - total_width // 2
+start_y = 350
+
+slots = [
+    {
+        "rect": pygame.Rect(
+            start_x + c * (slot_size + spacing),
+            start_y + r * (slot_size + spacing),
+            slot_size,
+            slot_size
+        ),
+        "index": i + 1
+    }
+    for i, (r, c) in enumerate([(r, c) for r in range(rows) for c in range(cols)])
+]
@@ -0,0 +1,157 @@
+"""Nave controlada pelo jogador e as configurações das naves disponíveis"""
+
+import math
+
+import pygame
+
+from . import display
+from .assets import assets
+from .masks import surface_mask
+from .config import BLACK, HEIGHT, WHITE, WIDTH, YELLOW, ship_margin
+
+# Raio dos cantos arredondados dos projéteis (unidades lógicas)
+BULLET_RADIUS = 4
+
+def make_bullet_sprite(size, color, radius=BULLET_RADIUS):
+    """Pré-renderiza o projétil (retângulo arredondado) na escala do alvo de renderização"""
+    w, h = max(1, display.px(size[0])), max(1, display.px(size[1]))
+    sprite = pygame.Surface((w, h))
+    sprite.set_colorkey(BLACK, pygame.RLEACCEL)
+    pygame.draw.rect(sprite, color, (0, 0, w, h), border_radius=max(1, display.px(radius)))
+    return sprite.convert()
+
+# =============================================================================
+# CLASSE DA NAVE DO JOGADOR
+# =============================================================================
+
+class Ship:
+    """Representa a nave controlada pelo jogador"""
+    
+    __slots__ = ("image_name", "img", "bullet_img", "rect", "speed", "bullet_color", "bullet_speed",
+                 "shoot_type", "shoot_cooldown", "last_shot_time", "shot_rect", "laser_rect", "mask",
+                 "prev_pos", "laser_active", "laser_start_time")
+    
+    # Tamanho dos projéteis comuns (unidades lógicas)
+    BULLET_SIZE = (20, 6)
+    
+    def __init__(self, img, speed, bullet_color, bullet_speed, size, shoot_type, shoot_cooldown):
+        # A imagem está na resolução de renderização; o retângulo, em unidades lógicas
+        self.image_name = img
+        self.rect = pygame.Rect((0, 0), size)
+        self.rect.center = (100, HEIGHT // 2)
+        # Máscara de colisão por pixel, da imagem na resolução lógica
+        self.mask = surface_mask(assets.get_scaled(img, size, scale=1.0), size)
+        self.speed = speed
+        self.bullet_color = bullet_color
+        self.rescale()
+        self.bullet_speed = bullet_speed
+        self.shoot_type = shoot_type
+        self.shoot_cooldown = shoot_cooldown
+        self.last_shot_time = -math.inf
+        
+        # Retângulos dos disparos, reaproveitados (valem até o próximo disparo)
+        self.shot_rect = pygame.Rect((0, 0), self.BULLET_SIZE)
+        self.laser_rect = pygame.Rect(0, 0, 0, 0)
+        
+        # Posição no passo anterior, usada para interpolar a renderização
+        self.prev_pos = self.rect.topleft
+        
+        # Estado do laser (apenas para naves com laser)
+        self.laser_active = False
+        self.laser_start_time = 0
+
+    def rescale(self):
+        """Refaz os sprites da nave e do projétil na escala de renderização atual"""
+        self.img = assets.get_scaled(self.image_name, self.rect.size)
+        self.bullet_img = make_bullet_sprite(self.BULLET_SIZE, self.bullet_color)
+
+    def move(self, keys):
+        """Move a nave baseado nas teclas pressionadas"""
+        self.prev_pos = self.rect.topleft
+        if keys[pygame.K_UP] or keys[pygame.K_w]:
+            self.rect.y -= self.speed
+        if keys[pygame.K_DOWN] or keys[pygame.K_s]:
+            self.rect.y += self.speed
+        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+            self.rect.x -= self.speed
+        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+            self.rect.x += self.speed
+
+        # Limita movimento dentro da área de jogo
+        margin = ship_margin
+        margin_y = int(self.rect.height * 0.98)
+        play_area = pygame.Rect(
+            margin, margin_y,
+            WIDTH - 4 * margin,
+            HEIGHT - 2 * margin_y
+        )
+        self.rect.clamp_ip(play_area)
+
+    def draw_pos(self, alpha):
+        """Posição interpolada entre o passo anterior e o atual"""
+        (px, py), (x, y) = self.prev_pos, self.rect.topleft
+        return (px + (x - px) * alpha, py + (y - py) * alpha)
+
+    def trigger_laser(self, now):
+        """Ativa o disparo do laser (now em ms do relógio da simulação)"""
+        if not self.laser_active and now - self.last_shot_time > self.shoot_cooldown:
+            self.laser_active = True
+            self.laser_start_time = now
+            self.last_shot_time = now
+
+    def shoot(self, now):
+        """Retorna o retângulo do projétil (laser ou bullet) se possível disparar"""
+        if self.shoot_type == "laser":
+            if self.laser_active:
+                # Verifica se o laser ainda está ativo
+                if now - self.laser_start_time > 1125:
+                    self.laser_active = False
+                    return None
+                self.laser_rect.update(
+                    self.rect.right - 10,
+                    self.rect.top + 15,
+                    WIDTH,
+                    self.rect.height - 30
+                )
+                return self.laser_rect
+            return None
+            
+        elif self.shoot_type == "bullet":
+            # Verifica cooldown
+            if now - self.last_shot_time < self.shoot_cooldown:
+                return None
+            self.last_shot_time = now
+            w, h = self.BULLET_SIZE
+            self.shot_rect.update(
+                self.rect.right - w,
+                self.rect.centery - h // 2,
+                w, h
+            )
+            return self.shot_rect
+
+# =============================================================================
+# CONFIGURAÇÕES DAS NAVES DISPONÍVEIS
+# =============================================================================
+
+ship1_cfg = {
+    "img": "ship1",
+    "speed": 9,
+    "bullet_color": WHITE,
+    "bullet_speed": 26,
+    "size": (141, 90),
+    "shoot_type": "bullet",
+    "shoot_cooldown": 100
+}
+
+ship2_cfg = {
+    "img": "ship2",
+    "speed": 5,
+    "bullet_color": YELLOW,
+    "bullet_speed": 10,
+    "size": (150, 105),
+    "shoot_type": "laser",
+    "shoot_cooldown": 2500
+}
+
+# Naves na ordem usada pelas gravações de partidas (replay)
+SHIP_CONFIGS = (ship1_cfg, ship2_cfg)
@@ -0,0 +1,101 @@
+"""Fundo estrelado em paralaxe, vetorizado com NumPy"""
+
+import random
+
+import numpy as np
+import pygame
+
+from .config import BLACK, HEIGHT, WHITE, WIDTH
+
+# Quantidade de estrelas e camadas de paralaxe (velocidade = raio em pixels)
+STAR_COUNT = 120
+STAR_LAYERS = (1, 2, 3)
+
+class Starfield:
+    """Campo de estrelas em camadas, atualizado e desenhado em lote"""
+    
+    def __init__(self, count=STAR_COUNT, layers=STAR_LAYERS, scale=1.0):
+        # Quantidade configurada e fração dela em uso (nível de qualidade)
+        self.base_count = count
+        self.density = 1.0
+        self.count = count
+        self.layers = layers
+        self.scale = scale
+        self.sprites = self._make_sprites()
+        self.reset()
+
+    def set_scale(self, scale):
+        """Refaz os sprites para outra escala de renderização, mantendo as estrelas"""
+        self.scale = scale
+        self.sprites = self._make_sprites()
+        self._star_sprites = [self.sprites[i] for i in self.layer.tolist()]
+
+    def _make_sprites(self):
+        return [self._make_sprite(max(1, round(radius * self.scale))) for radius in self.layers]
+
+    @staticmethod
+    def _make_sprite(radius):
+        sprite = pygame.Surface((radius * 2, radius * 2))
+        sprite.set_colorkey(BLACK, pygame.RLEACCEL)
+        pygame.draw.circle(sprite, WHITE, (radius, radius), radius)
+        return sprite.convert()
+
+    def reset(self, count=None, seed=None):
+        """Sorteia novas posições e camadas para todas as estrelas"""
+        if count is not None:
+            self.base_count = count
+        self.count = self._density_count()
+        
+        # Sem semente, o gerador deriva do random global
+        self.rng = np.random.default_rng(random.getrandbits(32) if seed is None else seed)
+        self.layer = self.rng.integers(0, len(self.layers), self.count)
+        radius = np.array(self.layers, np.float32)[self.layer]
+        
+        self.x = self.rng.integers(0, WIDTH + 1, self.count).astype(np.float32)
+        self.y = self.rng.integers(0, HEIGHT + 1, self.count).astype(np.float32)
+        self.speed = radius
+        self.radius = radius
+        self._star_sprites = [self.sprites[i] for i in self.layer.tolist()]
+
+    def _density_count(self):
+        return max(1, round(self.base_count * self.density))
+
+    def set_density(self, density):
+        """Usa só esta fração da quantidade configurada, sem reposicionar as que ficam"""
+        self.density = density
+        self.resize(self._density_count())
+
+    def resize(self, count):
+        """Muda a quantidade de estrelas sem reposicionar as que ficam"""
+        if count == self.count:
+            return
+        if count > self.count:
+            n = count - self.count
+            layer = self.rng.integers(0, len(self.layers), n)
+            radius = np.array(self.layers, np.float32)[layer]
+            self.layer = np.concatenate([self.layer, layer])
+            self.x = np.concatenate([self.x, self.rng.integers(0, WIDTH + 1, n).astype(np.float32)])
+            self.y = np.concatenate([self.y, self.rng.integers(0, HEIGHT + 1, n).astype(np.float32)])
+            self.speed = self.radius = np.concatenate([self.radius, radius])
+        else:
+            self.layer = self.layer[:count]
+            self.x = self.x[:count]
+            self.y = self.y[:count]
+            self.speed = self.radius = self.radius[:count]
+        self.count = count
+        self._star_sprites = [self.sprites[i] for i in self.layer.tolist()]
+
+    def update(self, speed_factor=1):
+        """Move todas as estrelas e recicla as que saíram pela esquerda"""
+        self.x -= self.speed * speed_factor
+        wrapped = self.x < 0
+        n = int(np.count_nonzero(wrapped))
+        if n:
+            self.x[wrapped] = WIDTH
+            self.y[wrapped] = self.rng.integers(0, HEIGHT + 1, n)
+
+    def items(self, lag=0.0):
+        """Pares (sprite, posição) de todas as estrelas, prontos para Surface.blits"""
+        xs = ((self.x + self.speed * lag - self.radius) * self.scale).tolist()
+        ys = ((self.y - self.radius) * self.scale).tolist()
+        return zip(self._star_sprites, zip(xs, ys))
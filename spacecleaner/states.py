@@ -0,0 +1,128 @@
+"""Estados do jogo e compositor de transições (fade, crossfade e wipe)"""
+
+from time import perf_counter
+
+from . import display
+from .cache import surface_pool
+from .config import FADE_DURATION
+
+# Estados possíveis
+MENU, CHARACTER_SELECT, GAME, PAUSE, LOSE = "menu", "character_select", "game", "pause", "lose"
+game_state = MENU
+
+# =============================================================================
+# SISTEMA DE TRANSIÇÕES
+# =============================================================================
+# Tipos de transição, todos com custo constante por frame:
+#   fade      - escurece o último frame do estado antigo e clareia o novo
+#   crossfade - o frame antigo some aos poucos sobre o novo estado
+#   wipe      - o novo estado é revelado da esquerda para a direita
+# O frame de saída é copiado uma vez para uma superfície persistente, em
+# vez de o estado antigo continuar sendo renderizado durante a transição.
+
+TRANSITION_KINDS = ("fade", "crossfade", "wipe")
+
+transition = {
+    "active": False,
+    "from": None,
+    "to": None,
+    "start_time": 0.0,
+    "phase": "fade_out",
+    "kind": "fade"
+}
+
+# Último frame do estado anterior e camada preta do fade (emprestados do pool)
+snapshot = None
+shade_overlay = None
+
+def capture_frame():
+    """Copia a tela atual para a superfície persistente da transição"""
+    global snapshot
+    screen = display.screen
+    if snapshot is not None and snapshot.get_size() != screen.get_size():
+        surface_pool.release(snapshot)
+        snapshot = None
+    if snapshot is None:
+        snapshot = surface_pool.acquire(screen.get_size())
+    snapshot.set_alpha(None)
+    snapshot.blit(screen, (0, 0))
+    return snapshot
+
+def request_state_change(new_state, kind="fade"):
+    """Inicia uma transição suave para um novo estado; retorna se foi aceita"""
+    global game_state
+    if transition["active"]:
+        return False
+    
+    capture_frame()
+    transition.update({
+        "active": True,
+        "from": game_state,
+        "to": new_state,
+        "start_time": perf_counter(),
+        "phase": "fade_out" if kind == "fade" else "reveal",
+        "kind": kind
+    })
+    
+    # Crossfade e wipe mostram o novo estado desde o primeiro frame
+    if kind != "fade":
+        game_state = new_state
+    return True
+
+def showing_snapshot():
+    """Indica se a tela está coberta pelo frame de saída (o estado não precisa renderizar)"""
+    return transition["active"] and transition["phase"] == "fade_out"
+
+def shade(surface, level):
+    """Escurece a superfície até level (0 = preto, 1 = inalterada)"""
+    global shade_overlay
+    alpha = int(255 * (1.0 - level))
+    if alpha <= 0:
+        return
+    
+    # Uma camada persistente com alpha por superfície: o blit com alpha do SDL
+    # é bem mais rápido que fill com BLEND_RGB_MULT na tela inteira
+    if shade_overlay is None or shade_overlay.get_size() != surface.get_size():
+        if shade_overlay is not None:
+            surface_pool.release(shade_overlay)
+        shade_overlay = surface_pool.acquire(surface.get_size())
+        shade_overlay.fill((0, 0, 0))
+    shade_overlay.set_alpha(alpha)
+    surface.blit(shade_overlay, (0, 0))
+
+def compose_transition(screen):
+    """Avança a transição ativa e a desenha na tela; retorna se houve transição"""
+    global game_state
+    if not transition["active"]:
+        return False
+    
+    elapsed = (perf_counter() - transition["start_time"]) * 1000
+    progress = min(elapsed / FADE_DURATION, 1.0)
+    phase, kind = transition["phase"], transition["kind"]
+    
+    if phase == "fade_out":
+        screen.blit(snapshot, (0, 0))
+        shade(screen, 1.0 - progress)
+        if progress >= 1.0:
+            # Troca o estado e inicia o fade in
+            game_state = transition["to"]
+            transition["phase"] = "fade_in"
+            transition["start_time"] = perf_counter()
+        return True
+    
+    if phase == "fade_in":
+        shade(screen, progress)
+    elif kind == "crossfade":
+        snapshot.set_alpha(int(255 * (1.0 - progress)))
+        screen.blit(snapshot, (0, 0))
+    elif kind == "wipe":
+        width, height = screen.get_size()
+        edge = int(width * progress)
+        screen.blit(snapshot, (edge, 0), (edge, 0, width - edge, height))
+    
+    if progress >= 1.0:
+        # Finaliza a transição
+        transition["active"] = False
+        transition["from"] = None
+        transition["to"] = None
+    return True
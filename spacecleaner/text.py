@@ -0,0 +1,99 @@
+"""Cache de fontes, textos e glifos, e os títulos neon pré-calculados"""
+
+import math
+
+import pygame
+
+from . import display
+from .cache import LRUCache, surface_bytes
+
+# =============================================================================
+# CACHE DE FONTES E TEXTOS
+# =============================================================================
+
+# Fontes por (nome, tamanho, negrito) e textos por (fonte, texto, cor)
+font_cache = LRUCache(16)
+text_cache = LRUCache(256)
+
+def get_font(size, bold=False, name=None):
+    """Retorna uma fonte do sistema (tamanho em pixels), consultando o SysFont só uma vez"""
+    key = (name, size, bold)
+    font = font_cache.get(key)
+    if font is None:
+        font = font_cache.put(key, pygame.font.SysFont(name, size, bold=bold))
+    return font
+
+def render_text(text, size, color, bold=False, name=None):
+    """Retorna a superfície do texto (tamanho lógico), renderizando apenas na primeira vez"""
+    size = max(1, display.px(size))
+    key = (name, size, bold, text, color)
+    surf = text_cache.get(key)
+    if surf is None:
+        surf = text_cache.put(key, get_font(size, bold, name).render(text, True, color))
+    return surf
+
+def number_glyphs(value, pos, size, color):
+    """Pares (glifo, posição) que compõem um número a partir de dígitos já renderizados"""
+    x, y = display.px(pos[0]), display.px(pos[1])
+    glyphs = []
+    for char in str(value):
+        glyph = render_text(char, size, color)
+        glyphs.append((glyph, (x, y)))
+        x += glyph.get_width()
+    return glyphs
+
+# =============================================================================
+# TÍTULO NEON
+# =============================================================================
+
+# Quadros do título neon: fases por ciclo de brilho e limite de memória
+NEON_PHASES = 24
+NEON_CACHE_BYTES = 48 * 1024 * 1024
+neon_cache = LRUCache(NEON_PHASES * 4, max_bytes=NEON_CACHE_BYTES)
+
+# Camadas do contorno neon (ajustadas pelo nível de qualidade)
+NEON_LAYERS = 7
+neon_layers = NEON_LAYERS
+
+def set_neon_layers(layers):
+    """Define quantas camadas o contorno dos próximos quadros terá"""
+    global neon_layers
+    neon_layers = max(1, layers)
+
+def bake_neon_frame(text, font_size, glow, layers=NEON_LAYERS):
+    """Renderiza um quadro do título neon para um nível de brilho (medidas lógicas)"""
+    px = display.px
+    font_title = get_font(max(1, px(font_size)), bold=True)
+    
+    # Renderiza texto principal
+    glow_color = (255, glow, 50)
+    title_surf = font_title.render(text, True, glow_color)
+    
+    # Cria contorno neon com múltiplas camadas
+    outline_surf = pygame.Surface(
+        (title_surf.get_width() + px(30), title_surf.get_height() + px(30)),
+        pygame.SRCALPHA
+    )
+    
+    # As camadas se espalham pelos mesmos 7 px de profundidade, quantas forem
+    outline = font_title.render(text, True, (255, glow * 0.7, 50, 25))
+    for i in range(layers):
+        offset = 1 + (i * 6 // (layers - 1) if layers > 1 else 0)
+        outline_surf.blit(outline, (px(offset + 10), px(offset + 10)))
+    
+    outline_surf.blit(title_surf, (px(15), px(15)))
+    return outline_surf
+
+def create_neon_title(text, font_size=200):
+    """Retorna o quadro pré-calculado do título neon mais próximo da fase atual"""
+    # Fase do brilho pulsante, quantizada em NEON_PHASES quadros por ciclo
+    t = pygame.time.get_ticks() * 0.004
+    phase = round(t / math.tau * NEON_PHASES) % NEON_PHASES
+    
+    key = (text, font_size, display.scale, neon_layers, phase)
+    frame = neon_cache.get(key)
+    if frame is None:
+        glow = 180 + 75 * math.sin(phase * math.tau / NEON_PHASES)
+        frame = bake_neon_frame(text, font_size, glow, neon_layers)
+        neon_cache.put(key, frame, surface_bytes(frame))
+    return frame